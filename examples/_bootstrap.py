@@ -0,0 +1,31 @@
+"""
+Shared setup for the example scripts
+Puts the project root on sys.path so `src` imports work when a script is run directly
+"""
+
+import os
+import sys
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import orjson
+
+from src.config import get_config
+
+
+def get_crawler():
+    """
+    Get the process-wide crawler
+    
+    Selenium is imported on first call, not when this module is imported.
+    """
+    from src.runtime import get_crawler as _get_crawler
+    return _get_crawler()
+
+
+def write_jsonl(f, record: dict):
+    """Append one record as a JSON line and flush it to disk"""
+    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    f.flush()
@@ -2,14 +2,14 @@
 Example script for scraping LinkedIn jobs
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import logging
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from src.crawler import LinkedInCrawler
-from src.config import Config
-from src.utils import setup_logging, print_banner
-import json
+from _bootstrap import get_config, get_crawler, write_jsonl
+from src.utils import setup_logging, print_banner, canonicalize_url
+
+logger = logging.getLogger(__name__)
 
 
 def scrape_jobs_example():
@@ -18,64 +18,93 @@ def scrape_jobs_example():
     print_banner()
     setup_logging()
     
-    # Initialize crawler
-    config = Config()
-    crawler = LinkedInCrawler(config)
+    # Shared crawler - closed automatically at exit
+    config = get_config()
+    crawler = get_crawler()
     
-    try:
-        # Login (optional)
-        # crawler.login()
-        
-        # Define search parameters
-        search_queries = [
-            {'keywords': 'Python Developer', 'location': 'United States', 'max': 5},
-            {'keywords': 'Data Scientist', 'location': 'Remote', 'max': 5},
-            {'keywords': 'Machine Learning Engineer', 'location': 'California', 'max': 5}
-        ]
-        
-        all_jobs = []
-        
+    # Login (optional)
+    # crawler.login()
+    
+    # Define search parameters
+    search_queries = [
+        {'keywords': 'Python Developer', 'location': 'United States', 'max': 5},
+        {'keywords': 'Data Scientist', 'location': 'Remote', 'max': 5},
+        {'keywords': 'Machine Learning Engineer', 'location': 'California', 'max': 5}
+    ]
+    
+    # Stream each job to disk as JSON Lines as soon as it is available
+    # Written to a .tmp file and renamed into place only on success, so an
+    # interrupted run never clobbers the previous complete output
+    output_file = Path('scraped_jobs.jsonl')
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    total_saved = 0
+    
+    # Searches and scrapes share one worker pool: each finished search
+    # immediately hands its uncached URLs to a batch of guest endpoint
+    # fetches, so no stage idles waiting for another.
+    with tmp_file.open('wb') as f, \
+            ThreadPoolExecutor(max_workers=config.CONCURRENCY) as executor:
+        pending = {}
+        seen = set()
         for query in search_queries:
-            print(f"\n{'='*60}")
-            print(f"Searching: {query['keywords']} in {query['location']}")
-            print('='*60)
-            
-            # Search for jobs
-            job_urls = crawler.search_jobs(
+            print(f"🔍 Searching: {query['keywords']} in {query['location']}")
+            future = executor.submit(
+                crawler.search_jobs,
                 query['keywords'],
                 query['location'],
                 query['max']
             )
+            pending[future] = query
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
             
-            print(f"Found {len(job_urls)} jobs")
-            
-            # Scrape each job
-            for i, url in enumerate(job_urls, 1):
-                print(f"\n[{i}/{len(job_urls)}] Scraping job...")
-                job_data = crawler.scrape_job(url)
+            for future in done:
+                query = pending.pop(future)
                 
-                if job_data:
-                    all_jobs.append(job_data)
-                    print(f"✅ {job_data.get('title')} at {job_data.get('company')}")
-                else:
-                    print("❌ Failed to scrape")
-        
-        # Save all jobs to JSON
-        output_file = 'scraped_jobs.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n✅ Scraped {len(all_jobs)} jobs")
-        print(f"📁 Data saved to {output_file}")
-        
-        # Display cache stats
-        stats = crawler.get_cache_stats()
-        print(f"\n📊 Cache Stats:")
-        print(f"   Total jobs cached: {stats['total_jobs']}")
-        print(f"   Database size: {stats['database_size_mb']} MB")
-        
-    finally:
-        crawler.close()
+                if query is not None:
+                    # Search finished - serve cached jobs, queue the misses.
+                    # Overlapping queries return the same postings, so jobs
+                    # already handled for an earlier query are dropped.
+                    job_urls = [
+                        url for url in future.result()
+                        if canonicalize_url(url) not in seen
+                    ]
+                    seen.update(map(canonicalize_url, job_urls))
+                    print(f"\n{'='*60}")
+                    print(f"Found {len(job_urls)} new jobs for {query['keywords']} in {query['location']}")
+                    print('='*60)
+                    
+                    cached_jobs = crawler.get_cached_jobs(job_urls)
+                    for job_data in cached_jobs.values():
+                        write_jsonl(f, job_data)
+                        total_saved += 1
+                        logger.info("Scraped %s at %s (cached)", job_data.get('title'), job_data.get('company'))
+                    
+                    missing_urls = [url for url in job_urls if url not in cached_jobs]
+                    if missing_urls:
+                        pending[executor.submit(crawler.scrape_jobs_bulk, missing_urls)] = None
+                    continue
+                
+                # Batch of guest endpoint fetches finished
+                for job_data in future.result():
+                    if job_data:
+                        write_jsonl(f, job_data)
+                        total_saved += 1
+                        logger.info("Scraped %s at %s", job_data.get('title'), job_data.get('company'))
+                    else:
+                        logger.warning("Failed to scrape a job")
+    
+    tmp_file.replace(output_file)
+    
+    print(f"\n✅ Scraped {total_saved} jobs")
+    print(f"📁 Data saved to {output_file}")
+    
+    # Display cache stats
+    stats = crawler.get_cache_stats()
+    print(f"\n📊 Cache Stats:")
+    print(f"   Total jobs cached: {stats['total_jobs']}")
+    print(f"   Database size: {stats['database_size_mb']} MB")
 
 
 if __name__ == "__main__":
@@ -2,97 +2,138 @@
 Example script for scraping LinkedIn profiles
 """
 
+import argparse
+import logging
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from pathlib import Path
 
-from src.crawler import LinkedInCrawler
-from src.config import Config
-from src.utils import setup_logging, print_banner, validate_url
-import json
+from _bootstrap import get_config, get_crawler, write_jsonl
+from src.utils import setup_logging, print_banner, validate_url, find_urls
 
+logger = logging.getLogger(__name__)
 
-def scrape_profiles_example():
-    """Example: Scrape multiple LinkedIn profiles"""
+
+def prompt_profile_urls() -> list:
+    """Ask for profile URLs one per line until an empty line"""
+    profile_urls = []
+    
+    print("\n" + "="*60)
+    print("Enter LinkedIn profile URLs (one per line)")
+    print("Press Enter twice when done")
+    print("="*60)
+    
+    while True:
+        url = input("Profile URL: ").strip()
+        if not url:
+            break
+        
+        if validate_url(url, 'profile'):
+            profile_urls.append(url)
+            print("✅ Added")
+        else:
+            print("❌ Invalid LinkedIn profile URL")
+    
+    return profile_urls
+
+
+def scrape_profiles_example(urls_file: str = None, from_stdin: bool = False):
+    """
+    Example: Scrape multiple LinkedIn profiles
+    
+    Args:
+        urls_file: Text file to pull profile URLs from (prompts if None)
+        from_stdin: Pull profile URLs from standard input instead (implied
+            when standard input is not a terminal)
+    """
     
     print_banner()
     setup_logging()
     
-    # Initialize crawler
-    config = Config()
-    crawler = LinkedInCrawler(config)
+    # Piped input (python scrape_profiles.py < urls.txt) is read in bulk
+    # rather than one input() call per line
+    if not urls_file and not sys.stdin.isatty():
+        from_stdin = True
     
-    try:
-        # Login (required for profiles)
-        print("⚠️  Note: Login required to view profiles")
-        if config.LINKEDIN_EMAIL and config.LINKEDIN_PASSWORD:
-            crawler.login()
-        else:
-            email = input("LinkedIn Email: ")
-            password = input("LinkedIn Password: ")
-            crawler.login(email, password)
-        
-        # Profile URLs to scrape
-        profile_urls = []
-        
-        print("\n" + "="*60)
-        print("Enter LinkedIn profile URLs (one per line)")
-        print("Press Enter twice when done")
-        print("="*60)
-        
-        while True:
-            url = input("Profile URL: ").strip()
-            if not url:
-                break
-            
-            if validate_url(url, 'profile'):
-                profile_urls.append(url)
-                print("✅ Added")
-            else:
-                print("❌ Invalid LinkedIn profile URL")
-        
-        if not profile_urls:
-            print("No profiles to scrape!")
-            return
-        
-        # Scrape profiles
-        all_profiles = []
-        
-        print(f"\n{'='*60}")
-        print(f"Scraping {len(profile_urls)} profiles")
-        print('='*60)
-        
-        for i, url in enumerate(profile_urls, 1):
-            print(f"\n[{i}/{len(profile_urls)}] Scraping profile...")
-            profile_data = crawler.scrape_profile(url)
-            
+    # Bulk input is scanned in one regex pass over the whole text
+    profile_urls = None
+    if urls_file:
+        with open(urls_file, encoding='utf-8') as f:
+            profile_urls = find_urls(f.read(), 'profile')
+    elif from_stdin:
+        profile_urls = find_urls(sys.stdin.read(), 'profile')
+    
+    # Shared crawler - closed automatically at exit
+    config = get_config()
+    crawler = get_crawler()
+    
+    # Login (required for profiles)
+    print("⚠️  Note: Login required to view profiles")
+    if config.LINKEDIN_EMAIL and config.LINKEDIN_PASSWORD:
+        crawler.login()
+    elif from_stdin:
+        print("❌ Set LINKEDIN_EMAIL and LINKEDIN_PASSWORD when reading URLs from stdin")
+        return
+    else:
+        email = input("LinkedIn Email: ")
+        password = input("LinkedIn Password: ")
+        crawler.login(email, password)
+    
+    # Profile URLs to scrape
+    if profile_urls is None:
+        profile_urls = prompt_profile_urls()
+    
+    if not profile_urls:
+        print("No profiles to scrape!")
+        return
+    
+    # Stream each profile to disk as JSON Lines as soon as it is available
+    # Written to a .tmp file and renamed into place only on success, so an
+    # interrupted run never clobbers the previous complete output
+    output_file = Path('scraped_profiles.jsonl')
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    total_saved = 0
+    
+    print(f"\n{'='*60}")
+    print(f"Scraping {len(profile_urls)} profiles")
+    print('='*60)
+    
+    with tmp_file.open('wb') as f:
+        # Cached profiles come first; the misses are scraped in parallel by
+        # worker browsers that reuse the login session, and cached in batches
+        for i, (url, profile_data) in enumerate(crawler.iter_profiles(profile_urls), 1):
             if profile_data:
-                all_profiles.append(profile_data)
-                print(f"✅ {profile_data.get('name')}")
-                print(f"   {profile_data.get('headline')}")
-                print(f"   {profile_data.get('location')}")
+                write_jsonl(f, profile_data)
+                total_saved += 1
+                logger.info(
+                    "[%d/%d] Scraped %s | %s | %s", i, len(profile_urls),
+                    profile_data.get('name'), profile_data.get('headline'), profile_data.get('location')
+                )
             else:
-                print("❌ Failed to scrape")
-        
-        # Save to JSON
-        output_file = 'scraped_profiles.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_profiles, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n✅ Scraped {len(all_profiles)} profiles")
-        print(f"📁 Data saved to {output_file}")
-        
-        # Display cache stats
-        stats = crawler.get_cache_stats()
-        print(f"\n📊 Cache Stats:")
-        print(f"   Total profiles cached: {stats['total_profiles']}")
-        print(f"   Database size: {stats['database_size_mb']} MB")
-        
-    finally:
-        crawler.close()
+                logger.warning("[%d/%d] Failed to scrape %s", i, len(profile_urls), url)
+    
+    tmp_file.replace(output_file)
+    
+    print(f"\n✅ Scraped {total_saved} profiles")
+    print(f"📁 Data saved to {output_file}")
+    
+    # Display cache stats
+    stats = crawler.get_cache_stats()
+    print(f"\n📊 Cache Stats:")
+    print(f"   Total profiles cached: {stats['total_profiles']}")
+    print(f"   Database size: {stats['database_size_mb']} MB")
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Scrape LinkedIn profiles')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--urls', metavar='FILE', help='text file containing profile URLs')
+    source.add_argument('--stdin', action='store_true', help='read profile URLs from standard input (default when input is piped)')
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    scrape_profiles_example()
+    args = parse_args()
+    scrape_profiles_example(urls_file=args.urls, from_stdin=args.stdin)
 
 
@@ -6,14 +6,55 @@ Main script and example usage files
 
 import sys
 import os
+import asyncio
+import logging
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.crawler import LinkedInCrawler
-from src.config import Config
+from src.config import get_config
 from src.utils import setup_logging, print_banner
 
+logger = logging.getLogger(__name__)
+
+
+def log_job(position: str, job_data: dict):
+    """Log the summary line for one job"""
+    logger.info(
+        "[%s] Scraped %s | %s | %s | posted %s",
+        position,
+        job_data.get('title', 'N/A'),
+        job_data.get('company', 'N/A'),
+        job_data.get('location', 'N/A'),
+        job_data.get('posted_date', 'N/A')
+    )
+
+
+async def scrape_and_log(crawler, job_urls: list) -> int:
+    """
+    Scrape jobs, logging each one as soon as it arrives
+    
+    Args:
+        crawler: LinkedInCrawler instance
+        job_urls: Job URLs from the search
+        
+    Returns:
+        Number of jobs scraped (cached ones included)
+    """
+    done = scraped = 0
+    
+    # Cached jobs come first, then fetched jobs in completion order
+    async for url, job_data in crawler.iter_jobs_async(job_urls):
+        done += 1
+        position = f"{done}/{len(job_urls)}"
+        if job_data:
+            scraped += 1
+            log_job(position, job_data)
+        else:
+            logger.warning("[%s] Failed to scrape %s", position, url)
+    
+    return scraped
+
 
 def main():
     """Main execution function"""
@@ -22,12 +63,28 @@ def main():
     print_banner()
     
     # Setup logging
-    config = Config()
+    config = get_config()
     setup_logging(config.LOG_LEVEL, config.LOG_FILE)
     
+    # Example 1: Search and scrape jobs
+    print("\n" + "=" * 60)
+    print("📊 SEARCHING FOR JOBS")
+    print("=" * 60)
+    
+    try:
+        keywords = input("Enter job keywords (e.g., 'Python Developer'): ").strip()
+        location = input("Enter location (e.g., 'United States'): ").strip()
+        max_results = int(input("How many jobs to scrape? (1-20): ").strip() or "5")
+    except (KeyboardInterrupt, EOFError, ValueError) as e:
+        print(f"\n❌ Cancelled: {str(e) or 'interrupted by user'}")
+        return
+    
+    # Selenium is only imported once the prompts are answered
+    from src.runtime import get_crawler, close_crawler
+    
     # Initialize crawler
     print("\n🚀 Initializing LinkedIn Crawler...")
-    crawler = LinkedInCrawler(config)
+    crawler = get_crawler()
     
     try:
         # Login (optional - comment out if not needed)
@@ -38,15 +95,6 @@ def main():
         else:
             print("⚠️  No credentials provided - running without login\n")
         
-        # Example 1: Search and scrape jobs
-        print("=" * 60)
-        print("📊 SEARCHING FOR JOBS")
-        print("=" * 60)
-        
-        keywords = input("Enter job keywords (e.g., 'Python Developer'): ").strip()
-        location = input("Enter location (e.g., 'United States'): ").strip()
-        max_results = int(input("How many jobs to scrape? (1-20): ").strip() or "5")
-        
         print(f"\n🔍 Searching for: '{keywords}' in '{location}'...")
         job_urls = crawler.search_jobs(keywords, location, max_results)
         
@@ -61,19 +109,9 @@ def main():
         print("📥 SCRAPING JOB DETAILS")
         print("=" * 60 + "\n")
         
-        scraped_jobs = []
-        for i, url in enumerate(job_urls, 1):
-            print(f"[{i}/{len(job_urls)}] Scraping job...")
-            job_data = crawler.scrape_job(url)
-            
-            if job_data:
-                scraped_jobs.append(job_data)
-                print(f"✅ Title: {job_data.get('title', 'N/A')}")
-                print(f"   Company: {job_data.get('company', 'N/A')}")
-                print(f"   Location: {job_data.get('location', 'N/A')}")
-                print(f"   Posted: {job_data.get('posted_date', 'N/A')}\n")
-            else:
-                print(f"❌ Failed to scrape job\n")
+        # Cache misses are fetched concurrently over the guest endpoint
+        scraped = asyncio.run(scrape_and_log(crawler, job_urls))
+        print(f"\n✅ Scraped {scraped} of {len(job_urls)} jobs")
         
         # Display cache statistics
         print("\n" + "=" * 60)
@@ -86,6 +124,8 @@ def main():
         print(f"Valid Profiles: {stats['valid_profiles']}")
         print(f"Database Size: {stats['database_size_mb']} MB")
         print(f"Cache Expiry: {stats['cache_expiry_days']} days")
+        print(f"Session Hit Rate: {stats['session_hit_rate']}% "
+              f"({stats['session_hits']} hits / {stats['session_misses']} misses)")
         
         # Export option
         print("\n" + "=" * 60)
@@ -103,95 +143,10 @@ def main():
         print(f"\n❌ Error: {e}")
     finally:
         print("\n🔒 Closing crawler...")
-        crawler.close()
+        close_crawler()
         print("👋 Goodbye!\n")
 
 
 if __name__ == "__main__":
     main()
 
-
-# ==================== examples/scrape_jobs.py ====================
-
-"""
-Example script for scraping LinkedIn jobs
-"""
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from src.crawler import LinkedInCrawler
-from src.config import Config
-from src.utils import setup_logging, print_banner
-import json
-
-
-def scrape_jobs_example():
-    """Example: Search and scrape multiple jobs"""
-    
-    print_banner()
-    setup_logging()
-    
-    # Initialize crawler
-    config = Config()
-    crawler = LinkedInCrawler(config)
-    
-    try:
-        # Login (optional)
-        # crawler.login()
-        
-        # Define search parameters
-        search_queries = [
-            {'keywords': 'Python Developer', 'location': 'United States', 'max': 5},
-            {'keywords': 'Data Scientist', 'location': 'Remote', 'max': 5},
-            {'keywords': 'Machine Learning Engineer', 'location': 'California', 'max': 5}
-        ]
-        
-        all_jobs = []
-        
-        for query in search_queries:
-            print(f"\n{'='*60}")
-            print(f"Searching: {query['keywords']} in {query['location']}")
-            print('='*60)
-            
-            # Search for jobs
-            job_urls = crawler.search_jobs(
-                query['keywords'],
-                query['location'],
-                query['max']
-            )
-            
-            print(f"Found {len(job_urls)} jobs")
-            
-            # Scrape each job
-            for i, url in enumerate(job_urls, 1):
-                print(f"\n[{i}/{len(job_urls)}] Scraping job...")
-                job_data = crawler.scrape_job(url)
-                
-                if job_data:
-                    all_jobs.append(job_data)
-                    print(f"✅ {job_data.get('title')} at {job_data.get('company')}")
-                else:
-                    print("❌ Failed to scrape")
-        
-        # Save all jobs to JSON
-        output_file = 'scraped_jobs.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n✅ Scraped {len(all_jobs)} jobs")
-        print(f"📁 Data saved to {output_file}")
-        
-        # Display cache stats
-        stats = crawler.get_cache_stats()
-        print(f"\n📊 Cache Stats:")
-        print(f"   Total jobs cached: {stats['total_jobs']}")
-        print(f"   Database size: {stats['database_size_mb']} MB")
-        
-    finally:
-        crawler.close()
-
-
-if __name__ == "__main__":
-    scrape_jobs_example()
\ No newline at end of file
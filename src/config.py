@@ -1,45 +1,86 @@
 """
 Configuration and Utility modules
 """
+import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration class for crawler settings"""
+    """
+    Configuration class for crawler settings
+    
+    Defaults are read from the environment once at import; every instance
+    is validated on construction.
+    """
     
     # LinkedIn credentials
-    LINKEDIN_EMAIL = os.getenv('LINKEDIN_EMAIL', '')
-    LINKEDIN_PASSWORD = os.getenv('LINKEDIN_PASSWORD', '')
+    LINKEDIN_EMAIL: str = os.getenv('LINKEDIN_EMAIL', '')
+    LINKEDIN_PASSWORD: str = os.getenv('LINKEDIN_PASSWORD', '')
+    COOKIE_CACHE_ENABLED: bool = os.getenv('COOKIE_CACHE_ENABLED', 'True').lower() == 'true'
+    COOKIE_CACHE_PATH: str = os.getenv('COOKIE_CACHE_PATH', '~/.cache/linkedin_crawler/cookies.json')
     
     # Browser settings
-    HEADLESS_MODE = os.getenv('HEADLESS_MODE', 'False').lower() == 'true'
-    CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', '')
+    HEADLESS_MODE: bool = os.getenv('HEADLESS_MODE', 'False').lower() == 'true'
+    CHROMEDRIVER_PATH: str = os.getenv('CHROMEDRIVER_PATH', '')
+    SELENIUM_GRID_URL: str = os.getenv('SELENIUM_GRID_URL', '')
+    BLOCK_RESOURCES: bool = os.getenv('BLOCK_RESOURCES', 'True').lower() == 'true'
     
     # Scraping settings
-    WAIT_TIMEOUT = int(os.getenv('WAIT_TIMEOUT', '10'))
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-    RETRY_DELAY = int(os.getenv('RETRY_DELAY', '2'))
+    WAIT_TIMEOUT: int = int(os.getenv('WAIT_TIMEOUT', '10'))
+    MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))
+    RETRY_DELAY: int = int(os.getenv('RETRY_DELAY', '2'))
+    CONCURRENCY: int = int(os.getenv('CONCURRENCY', '8'))
+    HTTP_CONCURRENCY: int = int(os.getenv('HTTP_CONCURRENCY', '10'))
+    GLOBAL_RPS: float = float(os.getenv('GLOBAL_RPS', '2'))
     
     # Cache settings
-    CACHE_EXPIRY_DAYS = int(os.getenv('CACHE_EXPIRY_DAYS', '7'))
-    DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/linkedin_cache.db')
+    CACHE_EXPIRY_DAYS: int = int(os.getenv('CACHE_EXPIRY_DAYS', '7'))
+    DATABASE_PATH: str = os.getenv('DATABASE_PATH', 'data/linkedin_cache.db')
     
     # Logging settings
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'logs/crawler.log')
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = os.getenv('LOG_FILE', 'logs/crawler.log')
+    
+    def __post_init__(self):
+        self.validate()
     
-    @classmethod
-    def validate(cls):
+    def validate(self):
         """Validate configuration"""
-        if not cls.LINKEDIN_EMAIL or not cls.LINKEDIN_PASSWORD:
-            print("Warning: LinkedIn credentials not set in .env file")
-        
-        if cls.MAX_RETRIES < 1:
+        if self.MAX_RETRIES < 1:
             raise ValueError("MAX_RETRIES must be at least 1")
         
-        if cls.CACHE_EXPIRY_DAYS < 1:
-            raise ValueError("CACHE_EXPIRY_DAYS must be at least 1")
\ No newline at end of file
+        if self.CONCURRENCY < 1:
+            raise ValueError("CONCURRENCY must be at least 1")
+        
+        if self.HTTP_CONCURRENCY < 1:
+            raise ValueError("HTTP_CONCURRENCY must be at least 1")
+        
+        if self.GLOBAL_RPS <= 0:
+            raise ValueError("GLOBAL_RPS must be positive")
+        
+        if self.CACHE_EXPIRY_DAYS < 1:
+            raise ValueError("CACHE_EXPIRY_DAYS must be at least 1")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the process-wide configuration
+    
+    Returns:
+        Shared Config instance (built on first call)
+    """
+    config = Config()
+    if not config.LINKEDIN_EMAIL or not config.LINKEDIN_PASSWORD:
+        logger.warning("LinkedIn credentials not set in .env file")
+    
+    return config
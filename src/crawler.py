@@ -3,10 +3,22 @@ LinkedIn Selenium Crawler - Main Crawler Class
 Handles all scraping operations with retry logic and caching
 """
 
+import os
+import json
 import time
+import random
+import shutil
+import tempfile
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -20,12 +32,347 @@ from selenium.common.exceptions import (
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
-from .database import Database
+from .database import acquire_database, release_database
 from .config import Config
-from .utils import generate_cache_key, setup_logging
+from .models import JobPosting, Profile
+from .utils import generate_cache_key, setup_logging, calculate_cache_hit_rate, extract_job_id
 
 logger = logging.getLogger(__name__)
 
+# Current desktop Chrome user agents; each browser and HTTP client picks
+# one, so concurrent workers do not all present the same fingerprint
+UA_POOL = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36'
+)
+
+# Injected into every new document of local browsers to hide automation
+STEALTH_JS = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+    "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});"
+    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});"
+)
+
+# Public job posting fragment served without login
+GUEST_JOB_URL = 'https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}'
+
+# Statuses LinkedIn answers with when the guest endpoint wants a session
+GUEST_AUTH_STATUSES = frozenset({401, 999})
+
+# Selector registries: each field maps to simple CSS selectors tried in
+# priority order, the first one with non-empty text wins
+
+# Logged-in job page
+JOB_SELECTORS = {
+    'title': ('h1.job-title', 'h1.t-24', 'h1.jobs-unified-top-card__job-title'),
+    'company': (
+        'a.job-card-container__company-name',
+        '.job-details-jobs-unified-top-card__company-name',
+        'a.jobs-unified-top-card__company-name'
+    ),
+    'location': (
+        '.job-details-jobs-unified-top-card__bullet',
+        '.job-card-container__metadata-item',
+        'span.jobs-unified-top-card__bullet'
+    ),
+    'description': (
+        '.jobs-description-content__text',
+        '.jobs-box__html-content',
+        'div.jobs-description__content'
+    ),
+    'posted_date': (
+        '.jobs-unified-top-card__posted-date',
+        'span.jobs-unified-top-card__subtitle-secondary-grouping'
+    ),
+    'job_type': ('span.jobs-unified-top-card__workplace-type',)
+}
+
+JOB_INSIGHT_SELECTOR = 'li.jobs-unified-top-card__job-insight'
+
+# Profile page
+PROFILE_SELECTORS = {
+    'name': ('h1.text-heading-xlarge', 'h1.inline.t-24'),
+    'headline': ('div.text-body-medium.break-words',),
+    'location': ('span.text-body-small.inline.t-black--light.break-words',),
+    'about': ('div.display-flex.ph5.pv3 span[aria-hidden="true"]',),
+    'connections': ('span.t-black--light span.t-bold',)
+}
+
+# Entity types of the profile record in the page's embedded JSON state
+PROFILE_ENTITY_TYPES = frozenset({
+    'com.linkedin.voyager.identity.profile.Profile',
+    'com.linkedin.voyager.dash.identity.profile.Profile'
+})
+
+# Guest job posting fragment
+GUEST_JOB_SELECTORS = {
+    'title': ('h2.top-card-layout__title', 'h1.top-card-layout__title'),
+    'company': ('a.topcard__org-name-link', 'span.topcard__flavor'),
+    'location': ('span.topcard__flavor--bullet',),
+    'description': ('div.show-more-less-html__markup', 'div.description__text'),
+    'posted_date': ('span.posted-time-ago__text',)
+}
+
+# Job criteria headings on the guest page mapped to job_data keys
+GUEST_JOB_CRITERIA = {
+    'seniority level': 'seniority_level',
+    'employment type': 'job_type'
+}
+
+# Elements waited on (any variant) before a page is parsed
+JOB_READY_SELECTOR = ', '.join(JOB_SELECTORS['title'])
+PROFILE_READY_SELECTOR = ', '.join(PROFILE_SELECTORS['name'])
+
+# Job search page; the query string is appended with urlencode
+SEARCH_BASE_URL = 'https://www.linkedin.com/jobs/search/?'
+
+# Job cards on the search results page
+JOB_CARD_SELECTOR = 'div.job-card-container, li.jobs-search-results__list-item'
+
+# Scrolls to the bottom and resolves with the job card count as soon as
+# enough cards (or any new ones) are in the DOM, or after the timeout
+WAIT_FOR_JOB_CARDS_JS = '''
+const [selector, wanted, timeoutMs] = arguments;
+const count = () => document.querySelectorAll(selector).length;
+const before = count();
+return new Promise(resolve => {
+    const done = () => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(count());
+    };
+    const observer = new MutationObserver(() => {
+        const now = count();
+        if (now >= wanted || now > before) done();
+    });
+    const timer = setTimeout(done, timeoutMs);
+    observer.observe(document.body, {childList: true, subtree: true});
+    window.scrollTo(0, document.body.scrollHeight);
+});
+'''
+
+# Job posting URLs (query string dropped) of the job cards, first link per
+# card, de-duplicated in page order and cut to N, read in one round trip.
+# Truncating last keeps promoted or repeated cards from eating into N.
+JOB_CARD_LINKS_JS = '''
+const [selector, limit] = arguments;
+const links = Array.from(document.querySelectorAll(selector))
+    .map(card => card.querySelector('a'))
+    .filter(a => a !== null && a.href && a.href.includes('/jobs/view/'))
+    .map(a => a.href.split('?')[0]);
+return [...new Set(links)].slice(0, limit);
+'''
+
+# Chrome switches that trim per-browser memory; scraping needs no caches,
+# translation, back/forward cache or extra renderer processes
+LEAN_CHROME_ARGS = (
+    '--disable-features=Translate,BackForwardCache,OptimizationHints',
+    '--disk-cache-size=1',
+    '--media-cache-size=1',
+    '--aggressive-cache-discard',
+    '--renderer-process-limit=1'
+)
+
+# Resources a text scraper never needs, blocked when BLOCK_RESOURCES is set
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.css',
+    '*/analytics*', '*doubleclick*', '*google-analytics*'
+]
+
+# Saved login cookies older than this are not reused
+COOKIE_MAX_AGE_DAYS = 7
+
+# Seconds to wait for lazy-loaded content after a scroll before assuming
+# the page has stopped growing
+SCROLL_SETTLE_TIMEOUT = 2
+
+
+def _first_text(tree: LexborHTMLParser, selectors: Tuple[str, ...]) -> str:
+    """
+    Text of the first selector that matches with non-empty text
+    
+    Args:
+        tree: Parsed page
+        selectors: CSS selectors in priority order
+        
+    Returns:
+        Matched text, or '' if none match
+    """
+    for selector in selectors:
+        node = tree.css_first(selector)
+        if node is not None:
+            text = node.text(strip=True, separator=' ')
+            if text:
+                return text
+    return ''
+
+
+def _parse_fields(tree: LexborHTMLParser, selectors: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """
+    Extract every field of a selector registry
+    
+    Args:
+        tree: Parsed page
+        selectors: Field name -> CSS selectors in priority order
+        
+    Returns:
+        Field name -> text ('N/A' when nothing matches)
+    """
+    return {field: _first_text(tree, sels) or 'N/A' for field, sels in selectors.items()}
+
+
+def _profile_from_embedded_json(tree: LexborHTMLParser) -> Dict[str, str]:
+    """
+    Extract profile fields from the JSON state LinkedIn embeds in <code> blocks
+    
+    The embedded records do not depend on CSS class names, which LinkedIn
+    renames often.
+    
+    Args:
+        tree: Parsed profile page
+        
+    Returns:
+        Field name -> value for the fields found (empty if no profile record)
+    """
+    for node in tree.css('code'):
+        text = node.text(strip=True)
+        if not text.startswith('{"data"'):
+            continue
+        
+        try:
+            payload = json.loads(text)
+            included = payload.get('included') or ()
+            for entity in included:
+                # 'included' also carries bare urn strings
+                if not isinstance(entity, dict):
+                    continue
+                if entity.get('$type') not in PROFILE_ENTITY_TYPES or not entity.get('firstName'):
+                    continue
+                
+                fields = {
+                    'name': ' '.join(filter(None, (entity.get('firstName'), entity.get('lastName')))),
+                    'headline': entity.get('headline'),
+                    'location': entity.get('locationName') or entity.get('geoLocationName'),
+                    'about': entity.get('summary')
+                }
+                return {field: value for field, value in fields.items() if value}
+        except (ValueError, AttributeError, TypeError):
+            continue
+    
+    return {}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting requests to a global rate
+    
+    Every caller reserves a token; when the bucket is empty the reservation
+    goes negative and the caller waits for its turn, so concurrent workers
+    are spread out evenly instead of bursting and backing off in lockstep.
+    """
+    
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket (starts full)
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """Block until a token is available"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait for a token without blocking the event loop"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class DriverPool:
+    """
+    Pool of WebDriver instances keyed by worker thread
+    
+    Selenium drivers are not thread-safe, so every thread gets its own
+    browser (local Chrome, or a Selenium Grid session). Drivers are keyed by
+    thread ident rather than held in threading.local so quit_all() can reach
+    every one of them. Drivers owned by threads that have exited are handed over to
+    the next thread that asks for one instead of launching a new browser.
+    """
+    
+    def __init__(self, factory):
+        """
+        Initialize the pool
+        
+        Args:
+            factory: Callable returning a new WebDriver
+        """
+        self._factory = factory
+        self._drivers = {}
+        self._lock = threading.Lock()
+    
+    def get(self) -> webdriver.Remote:
+        """Return the driver owned by the calling thread, creating it if needed"""
+        ident = threading.get_ident()
+        
+        with self._lock:
+            driver = self._drivers.get(ident)
+            if driver is not None:
+                return driver
+            
+            # Adopt a driver left behind by a finished thread
+            live_threads = {thread.ident for thread in threading.enumerate()}
+            for owner in list(self._drivers):
+                if owner not in live_threads:
+                    driver = self._drivers.pop(owner)
+                    self._drivers[ident] = driver
+                    return driver
+        
+        # Launch outside the lock - browser startup takes seconds
+        driver = self._factory()
+        with self._lock:
+            self._drivers[ident] = driver
+        return driver
+    
+    def quit_all(self):
+        """Quit every driver in the pool"""
+        with self._lock:
+            drivers = list(self._drivers.values())
+            self._drivers.clear()
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Failed to quit WebDriver: {e}")
+
 
 class LinkedInCrawler:
     """
@@ -37,8 +384,17 @@ class LinkedInCrawler:
     - Retry mechanism for timeouts and stale elements
     - Custom wait strategies
     - Structured error handling
+    - One WebDriver per thread, so scrape_job can run from a thread pool
+    - Bulk scraping across a worker pool, optionally on a Selenium Grid
+    - In-memory LRU in front of the SQLite cache for repeat lookups
     """
     
+    # Entries kept in the in-memory cache
+    MEM_CACHE_MAX = 4096
+    
+    # Scraped items written per transaction by the bulk methods
+    BULK_SAVE_SIZE = 50
+    
     def __init__(self, config: Config = None):
         """
         Initialize the crawler
@@ -47,16 +403,73 @@ class LinkedInCrawler:
             config: Configuration object (uses default if None)
         """
         self.config = config or Config()
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, self.config.WAIT_TIMEOUT)
-        self.db = Database(self.config.CACHE_EXPIRY_DAYS)
+        self._session_cookies = []
+        # Temporary Chrome profiles, one per local browser, removed on close()
+        self._profile_dirs = []
+        # Browsers start on first use, so guest-endpoint-only runs never launch one
+        self._driver_pool = DriverPool(self._new_pool_driver)
+        # Browser fallbacks from the async job scraper run here, so they open
+        # at most CONCURRENCY browsers (one per executor thread)
+        self._browser_executor = ThreadPoolExecutor(
+            max_workers=self.config.CONCURRENCY, thread_name_prefix='browser'
+        )
+        # Crawlers with the same cache settings share one connection
+        self.db = acquire_database(self.config.DATABASE_PATH, self.config.CACHE_EXPIRY_DAYS)
         self.max_retries = self.config.MAX_RETRIES
         self.retry_delay = self.config.RETRY_DELAY
+        # Shared by every worker: page loads and guest fetches alike
+        self.limiter = TokenBucket(self.config.GLOBAL_RPS)
+        
+        # Cache hits/misses for this session
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+        
+        # cache_key -> (monotonic expiry, JobPosting or Profile), least
+        # recently used first
+        self._mem_cache = OrderedDict()
+        self._mem_cache_lock = threading.Lock()
         
         logger.info("LinkedInCrawler initialized successfully")
     
-    def _setup_driver(self) -> webdriver.Chrome:
-        """Setup Chrome WebDriver with anti-detection options"""
+    @property
+    def driver(self) -> webdriver.Remote:
+        """WebDriver owned by the calling thread"""
+        return self._driver_pool.get()
+    
+    @property
+    def wait(self) -> WebDriverWait:
+        """WebDriverWait bound to the calling thread's driver"""
+        return WebDriverWait(self.driver, self.config.WAIT_TIMEOUT)
+    
+    def _new_pool_driver(self) -> webdriver.Remote:
+        """Create a driver for the pool, signed in if login() already ran"""
+        driver = self._make_driver(self.config.SELENIUM_GRID_URL or None)
+        
+        # Reuse the logged-in session so every worker sees authenticated pages
+        if self._session_cookies:
+            try:
+                self.limiter.acquire()
+                driver.get('https://www.linkedin.com')
+                for cookie in self._session_cookies:
+                    driver.add_cookie(cookie)
+            except Exception:
+                # Do not leak the browser that was just launched
+                driver.quit()
+                raise
+        
+        return driver
+    
+    def _make_driver(self, remote_url: str = None) -> webdriver.Remote:
+        """
+        Create a Chrome WebDriver with anti-detection options
+        
+        Args:
+            remote_url: Selenium Grid hub URL (launches a local Chrome if None)
+            
+        Returns:
+            New WebDriver instance
+        """
         chrome_options = Options()
         
         # Headless mode
@@ -71,31 +484,48 @@ class LinkedInCrawler:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # User agent
-        chrome_options.add_argument(
-            'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/120.0.0.0 Safari/537.36'
-        )
+        chrome_options.add_argument(f'user-agent={random.choice(UA_POOL)}')
         
         # Window size
         chrome_options.add_argument('--start-maximized')
         
+        # Memory: every worker runs its own browser
+        for arg in LEAN_CHROME_ARGS:
+            chrome_options.add_argument(arg)
+        
+        # Return from get() at DOMContentLoaded and skip images; scraping
+        # only needs the markup
+        if self.config.BLOCK_RESOURCES:
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option(
+                'prefs', {'profile.managed_default_content_settings.images': 2}
+            )
+        
         # Create driver
         try:
+            if remote_url:
+                driver = webdriver.Remote(command_executor=remote_url, options=chrome_options)
+                logger.info(f"Remote WebDriver session started on {remote_url}")
+                return driver
+            
+            # Concurrent local browsers cannot share a profile directory
+            profile_dir = tempfile.mkdtemp(prefix='chrome-prof-')
+            self._profile_dirs.append(profile_dir)
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+            
             if self.config.CHROMEDRIVER_PATH:
                 service = Service(self.config.CHROMEDRIVER_PATH)
                 driver = webdriver.Chrome(service=service, options=chrome_options)
             else:
                 driver = webdriver.Chrome(options=chrome_options)
             
-            # Execute CDP commands for stealth
-            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    })
-                '''
-            })
+            # Execute CDP commands for stealth (local Chrome only)
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_JS})
+            
+            if self.config.BLOCK_RESOURCES:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
             
             logger.info("Chrome WebDriver initialized")
             return driver
@@ -108,7 +538,8 @@ class LinkedInCrawler:
         """
         Retry mechanism for handling timeouts and stale elements
         
-        Implements exponential backoff and page refresh on stale elements
+        Retries right away - attempts are paced by the shared rate limiter,
+        not a backoff sleep - and refreshes the page on stale elements
         Improves reliability by 30%
         """
         for attempt in range(self.max_retries):
@@ -122,16 +553,12 @@ class LinkedInCrawler:
                 )
                 
                 if attempt < self.max_retries - 1:
-                    # Exponential backoff
-                    sleep_time = self.retry_delay * (2 ** attempt)
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
-                    
                     # Refresh page on stale element
                     if isinstance(e, StaleElementReferenceException):
                         logger.info("Refreshing page due to stale element")
+                        self.limiter.acquire()
                         self.driver.refresh()
-                        time.sleep(2)
+                        self._wait_for_ready(self.driver)
                 else:
                     logger.error(f"Max retries reached for {func.__name__}")
                     raise
@@ -140,6 +567,63 @@ class LinkedInCrawler:
                 logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
                 raise
     
+    def _wait_for_ready(self, driver: webdriver.Remote):
+        """Block until the current document has been parsed"""
+        # 'interactive' is enough - subresources are not needed (and may be blocked)
+        WebDriverWait(driver, self.config.WAIT_TIMEOUT).until(
+            lambda d: d.execute_script('return document.readyState') != 'loading'
+        )
+    
+    def _wait_for(self, driver: webdriver.Remote, css: str, timeout: float = None) -> bool:
+        """
+        Wait for an element to be present without raising
+        
+        Missing or stale elements are ignored while polling, and a timeout is
+        reported as False, so callers need no try/except of their own.
+        
+        Args:
+            driver: WebDriver showing the page
+            css: CSS selector to wait for
+            timeout: Seconds to wait (WAIT_TIMEOUT if None)
+            
+        Returns:
+            bool: True if the element appeared in time
+        """
+        wait = WebDriverWait(
+            driver,
+            timeout or self.config.WAIT_TIMEOUT,
+            poll_frequency=0.2,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        )
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, css)))
+            return True
+        except TimeoutException:
+            return False
+    
+    def _scroll_until_stable(self, driver: webdriver.Remote, max_scrolls: int = 3):
+        """
+        Scroll to the bottom until lazy-loaded content stops arriving
+        
+        Each scroll waits for document.body.scrollHeight to grow instead of
+        sleeping a fixed time; the first scroll that adds nothing ends it.
+        
+        Args:
+            driver: WebDriver showing the page
+            max_scrolls: Upper bound on scrolls
+        """
+        height = driver.execute_script('return document.body.scrollHeight')
+        
+        for _ in range(max_scrolls):
+            driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+            try:
+                WebDriverWait(driver, SCROLL_SETTLE_TIMEOUT, poll_frequency=0.2).until(
+                    lambda d: d.execute_script('return document.body.scrollHeight') > height
+                )
+            except TimeoutException:
+                break
+            height = driver.execute_script('return document.body.scrollHeight')
+    
     def login(self, email: str = None, password: str = None) -> bool:
         """
         Login to LinkedIn
@@ -158,9 +642,17 @@ class LinkedInCrawler:
             logger.error("Email and password are required for login")
             return False
         
+        # A saved session skips the login form (and most checkpoints)
+        if self.config.COOKIE_CACHE_ENABLED and self._restore_session(email):
+            logger.info(f"Reused saved session for: {email}")
+            return True
+        
         logger.info(f"Attempting to login with email: {email}")
         
         def _perform_login():
+            # Paced like every other page load, so failed attempts are not
+            # retried back-to-back
+            self.limiter.acquire()
             self.driver.get('https://www.linkedin.com/login')
             
             # Enter email
@@ -197,11 +689,106 @@ class LinkedInCrawler:
                 logger.warning("LinkedIn verification required - please complete manually")
                 input("Press Enter after completing verification...")
             
+            # Pool drivers launched from now on start from this session
+            self._session_cookies = self.driver.get_cookies()
+            if self.config.COOKIE_CACHE_ENABLED:
+                self._save_cookies(email, self._session_cookies)
+            
             logger.info("Login successful!")
             return True
         
         return self._retry_on_failure(_perform_login)
     
+    def _restore_session(self, email: str) -> bool:
+        """
+        Load saved cookies for an account into the current driver
+        
+        Args:
+            email: LinkedIn email the cookies were saved under
+            
+        Returns:
+            bool: True if the saved session is still logged in
+        """
+        cookies = self._load_cookies(email)
+        if not cookies:
+            return False
+        
+        try:
+            self.limiter.acquire()
+            self.driver.get('https://www.linkedin.com')
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+            self.limiter.acquire()
+            self.driver.get('https://www.linkedin.com/feed/')
+        except WebDriverException as e:
+            logger.warning(f"Failed to restore saved session: {e}")
+            return False
+        
+        if 'feed' not in self.driver.current_url:
+            logger.info("Saved session expired - logging in again")
+            return False
+        
+        self._session_cookies = cookies
+        return True
+    
+    def _load_cookies(self, email: str) -> List[Dict]:
+        """Return the saved cookies for an account, or [] if missing or stale"""
+        path = os.path.expanduser(self.config.COOKIE_CACHE_PATH)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f).get(email)
+        except (OSError, ValueError, AttributeError):
+            return []
+        
+        if not entry:
+            return []
+        
+        # A malformed entry is treated like a missing one: log in again
+        try:
+            age = datetime.now() - datetime.fromisoformat(entry['saved_at'])
+            cookies = entry['cookies']
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed saved cookies for {email}: {e}")
+            return []
+        
+        if age.days >= COOKIE_MAX_AGE_DAYS or not isinstance(cookies, list):
+            return []
+        
+        return cookies
+    
+    def _save_cookies(self, email: str, cookies: List[Dict]):
+        """
+        Save an account's cookies, keeping other accounts' entries
+        
+        Failures are logged, not raised: the login itself has succeeded.
+        """
+        path = os.path.expanduser(self.config.COOKIE_CACHE_PATH)
+        
+        try:
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if not isinstance(saved, dict):
+                saved = {}
+        except (OSError, ValueError):
+            saved = {}
+        
+        saved[email] = {'saved_at': datetime.now().isoformat(), 'cookies': cookies}
+        
+        try:
+            # A bare file name has no directory to create
+            cookie_dir = os.path.dirname(path)
+            if cookie_dir:
+                os.makedirs(cookie_dir, exist_ok=True)
+            
+            # Session cookies are credentials - keep the file private to the user
+            tmp_path = path + '.tmp'
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save login cookies to {path}: {e}")
+    
     def scrape_job(self, job_url: str) -> Optional[Dict]:
         """
         Scrape job posting data with caching
@@ -215,130 +802,35 @@ class LinkedInCrawler:
         cache_key = generate_cache_key(job_url)
         
         # Check cache first
-        cached_data = self.db.get_cached_job(cache_key)
+        cached_data = self._recall(cache_key)
+        if cached_data is None:
+            cached_data = self.db.get_cached_job(cache_key)
+            if cached_data:
+                self._remember(cache_key, self._as_record(JobPosting, cached_data))
+        
         if cached_data:
             logger.info(f"Cache hit for job: {job_url}")
+            self._record_cache_lookup(hits=1)
             return cached_data
         
-        logger.info(f"Scraping job: {job_url}")
+        self._record_cache_lookup(misses=1)
+        job = self._scrape_job_in_browser(job_url)
+        if job is None:
+            return None
         
-        def _scrape():
-            self.driver.get(job_url)
-            time.sleep(3)  # Allow dynamic content to load
-            
-            job_data = {
-                'url': job_url,
-                'scraped_at': datetime.now().isoformat()
-            }
-            
-            # Extract job title
-            try:
-                title = self.wait.until(
-                    EC.presence_of_element_located((
-                        By.CSS_SELECTOR, 
-                        'h1.job-title, h1.t-24, h1.jobs-unified-top-card__job-title'
-                    ))
-                ).text.strip()
-                job_data['title'] = title
-            except Exception as e:
-                logger.warning(f"Failed to extract title: {e}")
-                job_data['title'] = 'N/A'
-            
-            # Extract company
-            try:
-                company = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    'a.job-card-container__company-name, '
-                    '.job-details-jobs-unified-top-card__company-name, '
-                    'a.jobs-unified-top-card__company-name'
-                ).text.strip()
-                job_data['company'] = company
-            except Exception as e:
-                logger.warning(f"Failed to extract company: {e}")
-                job_data['company'] = 'N/A'
-            
-            # Extract location
-            try:
-                location = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    '.job-details-jobs-unified-top-card__bullet, '
-                    '.job-card-container__metadata-item, '
-                    'span.jobs-unified-top-card__bullet'
-                ).text.strip()
-                job_data['location'] = location
-            except Exception as e:
-                logger.warning(f"Failed to extract location: {e}")
-                job_data['location'] = 'N/A'
-            
-            # Extract description
-            try:
-                # Try to click "Show more" if exists
-                try:
-                    show_more = self.driver.find_element(
-                        By.CSS_SELECTOR,
-                        'button[aria-label*="Show more"]'
-                    )
-                    show_more.click()
-                    time.sleep(1)
-                except:
-                    pass
-                
-                description = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    '.jobs-description-content__text, '
-                    '.jobs-box__html-content, '
-                    'div.jobs-description__content'
-                ).text.strip()
-                job_data['description'] = description
-            except Exception as e:
-                logger.warning(f"Failed to extract description: {e}")
-                job_data['description'] = 'N/A'
-            
-            # Extract posted date
-            try:
-                posted = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    '.jobs-unified-top-card__posted-date, '
-                    'span.jobs-unified-top-card__subtitle-secondary-grouping'
-                ).text.strip()
-                job_data['posted_date'] = posted
-            except Exception as e:
-                logger.warning(f"Failed to extract posted date: {e}")
-                job_data['posted_date'] = 'N/A'
-            
-            # Extract job type (Full-time, Part-time, etc.)
-            try:
-                job_type = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'span.jobs-unified-top-card__workplace-type'
-                ).text.strip()
-                job_data['job_type'] = job_type
-            except:
-                job_data['job_type'] = 'N/A'
-            
-            # Extract seniority level
-            try:
-                criteria_items = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    'li.jobs-unified-top-card__job-insight'
-                )
-                for item in criteria_items:
-                    text = item.text.strip()
-                    if 'level' in text.lower():
-                        job_data['seniority_level'] = text
-                        break
-                else:
-                    job_data['seniority_level'] = 'N/A'
-            except:
-                job_data['seniority_level'] = 'N/A'
-            
-            logger.info(f"Successfully scraped job: {job_data.get('title', 'Unknown')}")
-            return job_data
+        job_data = job.to_dict()
+        self.db.save_job(cache_key, job_data)
+        self._remember(cache_key, job)
+        return job_data
+    
+    def _scrape_job_in_browser(self, job_url: str) -> Optional[JobPosting]:
+        """Scrape a job in the calling thread's browser (not cached)"""
+        logger.info(f"Scraping job: {job_url}")
         
         try:
-            job_data = self._retry_on_failure(_scrape)
-            self.db.save_job(cache_key, job_data)
-            return job_data
+            return self._retry_on_failure(
+                self._scrape_job_with_driver, self.driver, job_url
+            )
         except Exception as e:
             logger.error(f"Failed to scrape job {job_url}: {e}")
             return None
@@ -356,97 +848,376 @@ class LinkedInCrawler:
         cache_key = generate_cache_key(profile_url)
         
         # Check cache first
-        cached_data = self.db.get_cached_profile(cache_key)
+        cached_data = self._recall(cache_key)
+        if cached_data is None:
+            cached_data = self.db.get_cached_profile(cache_key)
+            if cached_data:
+                self._remember(cache_key, self._as_record(Profile, cached_data))
+        
         if cached_data:
             logger.info(f"Cache hit for profile: {profile_url}")
+            self._record_cache_lookup(hits=1)
             return cached_data
         
+        self._record_cache_lookup(misses=1)
+        profile = self._scrape_profile_in_browser(profile_url)
+        if profile is None:
+            return None
+        
+        profile_data = profile.to_dict()
+        self.db.save_profile(cache_key, profile_data)
+        self._remember(cache_key, profile)
+        return profile_data
+    
+    def _scrape_profile_in_browser(self, profile_url: str) -> Optional[Profile]:
+        """Scrape a profile in the calling thread's browser (not cached)"""
         logger.info(f"Scraping profile: {profile_url}")
         
-        def _scrape():
-            self.driver.get(profile_url)
-            time.sleep(3)
+        try:
+            return self._retry_on_failure(
+                self._scrape_profile_with_driver, self.driver, profile_url
+            )
+        except Exception as e:
+            logger.error(f"Failed to scrape profile {profile_url}: {e}")
+            return None
+    
+    def scrape_jobs_bulk(self, job_urls: List[str]) -> List[Optional[Dict]]:
+        """
+        Scrape several job postings concurrently
+        
+        Synchronous entry point for scrape_jobs_async; must not be called
+        from a running event loop.
+        
+        Args:
+            job_urls: URLs of the LinkedIn job postings
             
-            # Scroll to load all sections
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        Returns:
+            Job data (or None if failed) for each URL, in input order
+        """
+        return asyncio.run(self.scrape_jobs_async(job_urls))
+    
+    async def scrape_jobs_async(self, job_urls: List[str]) -> List[Optional[Dict]]:
+        """
+        Scrape several job postings over the public guest endpoint
+        
+        Cached jobs are served from one batched lookup. The misses are fetched
+        as plain HTTP requests (at most HTTP_CONCURRENCY in flight) and parsed
+        without a browser; Selenium is only used for postings the guest
+        endpoint refuses to serve. Results are cached BULK_SAVE_SIZE at a time.
+        
+        Args:
+            job_urls: URLs of the LinkedIn job postings
             
-            profile_data = {
-                'url': profile_url,
-                'scraped_at': datetime.now().isoformat()
-            }
+        Returns:
+            Job data (or None if failed) for each URL, in input order
+        """
+        results = {job_url: job_data async for job_url, job_data in self.iter_jobs_async(job_urls)}
+        return [results[url] for url in job_urls]
+    
+    async def iter_jobs_async(self, job_urls: List[str]) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        """
+        Scrape several job postings, yielding each one as soon as it is done
+        
+        Cached jobs come first, then fetched jobs in completion order. Each
+        URL is yielded once; URLs sharing a cache key are fetched once and
+        yielded together. Fetched results are cached BULK_SAVE_SIZE at a
+        time while the remaining fetches are still in flight.
+        
+        Args:
+            job_urls: URLs of the LinkedIn job postings
             
-            # Extract name
-            try:
-                name = self.wait.until(
-                    EC.presence_of_element_located((
-                        By.CSS_SELECTOR, 
-                        'h1.text-heading-xlarge, h1.inline.t-24'
-                    ))
-                ).text.strip()
-                profile_data['name'] = name
-            except Exception as e:
-                logger.warning(f"Failed to extract name: {e}")
-                profile_data['name'] = 'N/A'
+        Yields:
+            (job URL, job data or None if failed) pairs
+        """
+        aliases = self._group_by_cache_key(job_urls)
+        cached = self.get_cached_jobs(job_urls)
+        missing = {key: urls for key, urls in aliases.items() if urls[0] not in cached}
+        self._record_cache_lookup(misses=len(missing))
+        
+        for item in cached.items():
+            yield item
+        
+        if not missing:
+            return
+        
+        semaphore = asyncio.Semaphore(self.config.HTTP_CONCURRENCY)
+        
+        async def _bounded_fetch(client, cache_key):
+            job_url = missing[cache_key][0]
+            async with semaphore:
+                # One bad URL must not abort the others
+                try:
+                    return cache_key, await self._fetch_job(client, job_url)
+                except Exception as e:
+                    logger.error(f"Failed to fetch job {job_url}: {e}")
+                    return cache_key, None
+        
+        pending = []
+        try:
+            async with httpx.AsyncClient(
+                http2=True,
+                headers={'User-Agent': random.choice(UA_POOL)},
+                follow_redirects=True,
+                timeout=self.config.WAIT_TIMEOUT
+            ) as client:
+                tasks = [asyncio.create_task(_bounded_fetch(client, key)) for key in missing]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        cache_key, job = await next_done
+                        if job:
+                            pending.append((cache_key, job))
+                        if len(pending) >= self.BULK_SAVE_SIZE:
+                            # SQLite writes block - keep them off the event loop
+                            await asyncio.to_thread(self._save_batch, self.db.save_jobs, pending)
+                            pending = []
+                        for job_url in missing[cache_key]:
+                            yield job_url, job.to_dict() if job else None
+                finally:
+                    # Stop fetches still in flight when the caller stops early
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Also runs when the caller stops iterating early
+            await asyncio.to_thread(self._save_batch, self.db.save_jobs, pending)
+    
+    async def _fetch_job(self, client: httpx.AsyncClient, job_url: str) -> Optional[JobPosting]:
+        """
+        Fetch and parse one job posting from the guest endpoint
+        
+        Every attempt waits for the shared rate limiter; HTTP 429 additionally
+        backs off exponentially. Falls back to the browser when LinkedIn asks for a session. The
+        result is not cached; the caller saves it.
+        
+        Args:
+            client: Shared HTTP client
+            job_url: URL of the LinkedIn job posting
             
-            # Extract headline
+        Returns:
+            Parsed job or None if failed
+        """
+        job_id = extract_job_id(job_url)
+        if not job_id:
+            return await self._scrape_job_in_browser_async(job_url)
+        
+        logger.info(f"Fetching job: {job_url}")
+        
+        for attempt in range(self.max_retries):
+            await self.limiter.acquire_async()
             try:
-                headline = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    'div.text-body-medium.break-words'
-                ).text.strip()
-                profile_data['headline'] = headline
-            except Exception as e:
-                logger.warning(f"Failed to extract headline: {e}")
-                profile_data['headline'] = 'N/A'
+                response = await client.get(GUEST_JOB_URL.format(job_id=job_id))
+            except httpx.HTTPError as e:
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed: {type(e).__name__}"
+                )
+            else:
+                if response.status_code in GUEST_AUTH_STATUSES:
+                    logger.info(f"Guest endpoint refused {job_url} - falling back to browser")
+                    return await self._scrape_job_in_browser_async(job_url)
+                
+                if response.status_code == 200:
+                    return self._parse_guest_job(response.text, job_url)
+                
+                if response.status_code != 429:
+                    logger.error(f"Failed to fetch job {job_url}: HTTP {response.status_code}")
+                    return None
+                
+                logger.warning(f"Attempt {attempt + 1}/{self.max_retries} rate limited")
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        
+        logger.error(f"Max retries reached fetching job {job_url}")
+        return None
+    
+    async def _scrape_job_in_browser_async(self, job_url: str) -> Optional[JobPosting]:
+        """Scrape a job in a browser on the browser executor (not cached)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._browser_executor, self._scrape_job_in_browser, job_url)
+    
+    def _parse_guest_job(self, html: str, job_url: str) -> JobPosting:
+        """
+        Parse the guest job posting fragment
+        
+        Args:
+            html: Guest endpoint response body
+            job_url: URL of the LinkedIn job posting
             
-            # Extract location
-            try:
-                location = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    'span.text-body-small.inline.t-black--light.break-words'
-                ).text.strip()
-                profile_data['location'] = location
-            except Exception as e:
-                logger.warning(f"Failed to extract location: {e}")
-                profile_data['location'] = 'N/A'
+        Returns:
+            Parsed job
+        """
+        tree = LexborHTMLParser(html)
+        
+        job = JobPosting(
+            url=job_url,
+            scraped_at=datetime.now().isoformat(),
+            **_parse_fields(tree, GUEST_JOB_SELECTORS)
+        )
+        
+        for item in tree.css('li.description__job-criteria-item'):
+            heading = item.css_first('h3')
+            value = item.css_first('span')
+            if heading and value:
+                field = GUEST_JOB_CRITERIA.get(heading.text(strip=True).lower())
+                if field:
+                    setattr(job, field, value.text(strip=True))
+        
+        logger.info(f"Successfully fetched job: {job.title}")
+        return job
+    
+    def scrape_profiles_bulk(self, profile_urls: List[str]) -> List[Optional[Dict]]:
+        """
+        Scrape several profiles in parallel
+        
+        Call login() first: worker browsers reuse its session cookies.
+        Results are cached BULK_SAVE_SIZE at a time.
+        
+        Args:
+            profile_urls: URLs of the LinkedIn profiles
             
-            # Extract about section
-            try:
-                about = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'div.display-flex.ph5.pv3 span[aria-hidden="true"]'
-                ).text.strip()
-                profile_data['about'] = about
-            except:
-                profile_data['about'] = 'N/A'
-            
-            # Extract connections count
-            try:
-                connections = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'span.t-black--light span.t-bold'
-                ).text.strip()
-                profile_data['connections'] = connections
-            except:
-                profile_data['connections'] = 'N/A'
+        Returns:
+            Profile data (or None if failed) for each URL, in input order
+        """
+        results = dict(self.iter_profiles(profile_urls))
+        return [results[url] for url in profile_urls]
+    
+    def iter_profiles(self, profile_urls: List[str]) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Scrape several profiles in parallel, yielding each one as soon as it is done
+        
+        Call login() first: worker browsers reuse its session cookies. Cached
+        profiles come first, then scraped profiles in completion order. Each
+        URL is yielded once; URLs sharing a cache key are scraped once and
+        yielded together. Scraped results are cached BULK_SAVE_SIZE at a
+        time while the remaining scrapes are still running.
+        
+        Args:
+            profile_urls: URLs of the LinkedIn profiles
             
-            logger.info(f"Successfully scraped profile: {profile_data.get('name', 'Unknown')}")
-            return profile_data
+        Yields:
+            (profile URL, profile data or None if failed) pairs
+        """
+        aliases = self._group_by_cache_key(profile_urls)
+        cached = self.get_cached_profiles(profile_urls)
+        missing = {key: urls for key, urls in aliases.items() if urls[0] not in cached}
+        self._record_cache_lookup(misses=len(missing))
         
+        yield from cached.items()
+        
+        if not missing:
+            return
+        
+        pending = []
+        handled = set()
+        executor = ThreadPoolExecutor(max_workers=self.config.CONCURRENCY)
+        futures = {
+            executor.submit(self._scrape_profile_in_browser, urls[0]): key
+            for key, urls in missing.items()
+        }
         try:
-            profile_data = self._retry_on_failure(_scrape)
-            self.db.save_profile(cache_key, profile_data)
-            return profile_data
-        except Exception as e:
-            logger.error(f"Failed to scrape profile {profile_url}: {e}")
-            return None
+            for future in as_completed(futures):
+                handled.add(future)
+                cache_key = futures[future]
+                profile = future.result()
+                if profile:
+                    pending.append((cache_key, profile))
+                if len(pending) >= self.BULK_SAVE_SIZE:
+                    self._save_batch(self.db.save_profiles, pending)
+                    pending = []
+                for profile_url in missing[cache_key]:
+                    yield profile_url, profile.to_dict() if profile else None
+        finally:
+            # When the caller stops early, drop the queued scrapes instead of
+            # waiting for them, but keep the ones that already finished
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future, cache_key in futures.items():
+                if future in handled or not future.done() or future.cancelled():
+                    continue
+                if future.exception() is None and future.result():
+                    pending.append((cache_key, future.result()))
+            self._save_batch(self.db.save_profiles, pending)
+    
+    def _save_batch(self, save_many, items: List[tuple]):
+        """Write (cache_key, record) pairs in one transaction and remember them"""
+        save_many([(cache_key, record.to_dict()) for cache_key, record in items])
+        for cache_key, record in items:
+            self._remember(cache_key, record)
+    
+    def _scrape_job_with_driver(self, driver: webdriver.Remote, job_url: str) -> JobPosting:
+        """
+        Load a job posting in the given driver and parse it
+        
+        Args:
+            driver: WebDriver to load the page in
+            job_url: URL of the LinkedIn job posting
+            
+        Returns:
+            Scraped job
+        """
+        self.limiter.acquire()
+        driver.get(job_url)
+        
+        # The title wait only synchronizes with rendering; every field is then
+        # parsed from one page_source snapshot instead of a round-trip each
+        if not self._wait_for(driver, JOB_READY_SELECTOR):
+            logger.warning(f"Job title did not render: {job_url}")
+        
+        tree = LexborHTMLParser(driver.page_source)
+        
+        job = JobPosting(
+            url=job_url,
+            scraped_at=datetime.now().isoformat(),
+            **_parse_fields(tree, JOB_SELECTORS)
+        )
+        
+        # Seniority level is one of several job insight items
+        for node in tree.css(JOB_INSIGHT_SELECTOR):
+            text = node.text(strip=True, separator=' ')
+            if 'level' in text.lower():
+                job.seniority_level = text
+                break
+        
+        logger.info(f"Successfully scraped job: {job.title}")
+        return job
+    
+    def _scrape_profile_with_driver(self, driver: webdriver.Remote, profile_url: str) -> Profile:
+        """
+        Load a profile in the given driver and parse it
+        
+        Args:
+            driver: WebDriver to load the page in
+            profile_url: URL of the LinkedIn profile
+            
+        Returns:
+            Scraped profile
+        """
+        self.limiter.acquire()
+        driver.get(profile_url)
+        
+        if not self._wait_for(driver, PROFILE_READY_SELECTOR):
+            logger.warning(f"Profile name did not render: {profile_url}")
+        
+        # Scroll to load all sections
+        self._scroll_until_stable(driver)
+        
+        tree = LexborHTMLParser(driver.page_source)
+        
+        # Embedded JSON first; selectors only for the fields it lacks
+        fields = _profile_from_embedded_json(tree)
+        for field, selectors in PROFILE_SELECTORS.items():
+            if field not in fields:
+                fields[field] = _first_text(tree, selectors) or 'N/A'
+        
+        profile = Profile(url=profile_url, scraped_at=datetime.now().isoformat(), **fields)
+        
+        logger.info(f"Successfully scraped profile: {profile.name}")
+        return profile
     
     def search_jobs(
         self, 
         keywords: str, 
         location: str = '', 
-        max_results: int = 10
+        max_results: int = 10,
+        posted_within: int = None
     ) -> List[str]:
         """
         Search for jobs and return job URLs
@@ -455,46 +1226,49 @@ class LinkedInCrawler:
             keywords: Job search keywords
             location: Location filter
             max_results: Maximum number of results to return
+            posted_within: Only jobs posted in the last N seconds
+                (e.g. 86400 for the past day; no limit if None)
             
         Returns:
             List of job URLs
         """
-        search_url = (
-            f"https://www.linkedin.com/jobs/search/"
-            f"?keywords={keywords.replace(' ', '%20')}"
-            f"&location={location.replace(' ', '%20')}"
-        )
+        params = {'keywords': keywords, 'location': location}
+        if posted_within:
+            params['f_TPR'] = f'r{posted_within}'
+        search_url = SEARCH_BASE_URL + urlencode(params)
         
         logger.info(f"Searching jobs: '{keywords}' in '{location}'")
         
         def _search():
-            self.driver.get(search_url)
-            time.sleep(3)
+            driver = self.driver
+            self.limiter.acquire()
+            driver.get(search_url)
+            self._wait_for_ready(driver)
             
-            # Scroll to load more jobs
+            if not self._wait_for(driver, JOB_CARD_SELECTOR):
+                logger.info("No job cards on the results page")
+                return []
+            
+            # Scroll to load more jobs only while more are needed; each scroll
+            # returns as soon as the browser reports new cards
+            card_count = len(driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR))
             for _ in range(3):
-                self.driver.execute_script(
-                    "window.scrollTo(0, document.body.scrollHeight);"
+                if card_count >= max_results:
+                    break
+                
+                loaded = driver.execute_script(
+                    WAIT_FOR_JOB_CARDS_JS,
+                    JOB_CARD_SELECTOR,
+                    max_results,
+                    SCROLL_SETTLE_TIMEOUT * 1000
                 )
-                time.sleep(2)
-            
-            # Extract job URLs
-            job_cards = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                'div.job-card-container, li.jobs-search-results__list-item'
-            )[:max_results]
+                if loaded <= card_count:
+                    break  # nothing more to load
+                card_count = loaded
             
-            job_links = []
-            for card in job_cards:
-                try:
-                    link = card.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
-                    if link and '/jobs/view/' in link:
-                        # Clean URL
-                        job_url = link.split('?')[0]
-                        job_links.append(job_url)
-                except Exception as e:
-                    logger.debug(f"Failed to extract link from card: {e}")
-                    continue
+            # Extract job URLs with one script call instead of one per card;
+            # the script filters and de-duplicates before applying the limit
+            job_links = driver.execute_script(JOB_CARD_LINKS_JS, JOB_CARD_SELECTOR, max_results)
             
             logger.info(f"Found {len(job_links)} job URLs")
             return job_links
@@ -505,20 +1279,154 @@ class LinkedInCrawler:
             logger.error(f"Failed to search jobs: {e}")
             return []
     
+    def get_cached_jobs(self, job_urls: List[str]) -> Dict[str, Dict]:
+        """
+        Look up several job URLs in the cache at once
+        
+        Args:
+            job_urls: Job URLs to look up
+            
+        Returns:
+            Dict mapping job URL to cached job data (misses are omitted;
+            every URL sharing a cached key is included)
+        """
+        aliases = self._group_by_cache_key(job_urls)
+        cached = self._recall_many(aliases, self.db.get_cached_jobs, JobPosting)
+        # Misses are counted when the URL is passed on to scrape_job
+        self._record_cache_lookup(hits=len(cached))
+        return {url: data for key, data in cached.items() for url in aliases[key]}
+    
+    def get_cached_profiles(self, profile_urls: List[str]) -> Dict[str, Dict]:
+        """
+        Look up several profile URLs in the cache at once
+        
+        Args:
+            profile_urls: Profile URLs to look up
+            
+        Returns:
+            Dict mapping profile URL to cached profile data (misses are
+            omitted; every URL sharing a cached key is included)
+        """
+        aliases = self._group_by_cache_key(profile_urls)
+        cached = self._recall_many(aliases, self.db.get_cached_profiles, Profile)
+        # Misses are counted when the URL is passed on to scrape_profile
+        self._record_cache_lookup(hits=len(cached))
+        return {url: data for key, data in cached.items() for url in aliases[key]}
+    
+    @staticmethod
+    def _group_by_cache_key(urls: List[str]) -> Dict[str, List[str]]:
+        """Map each cache key to its distinct URLs, both in first-seen order"""
+        aliases = {}
+        for url in dict.fromkeys(urls):
+            aliases.setdefault(generate_cache_key(url), []).append(url)
+        return aliases
+    
+    def _recall(self, cache_key: str) -> Optional[Dict]:
+        """Return an unexpired entry from the in-memory cache as a dict, or None"""
+        with self._mem_cache_lock:
+            entry = self._mem_cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            expires, record = entry
+            if time.monotonic() >= expires:
+                del self._mem_cache[cache_key]
+                return None
+            
+            self._mem_cache.move_to_end(cache_key)
+        
+        # A fresh dict per caller, so callers cannot modify the cached entry
+        return dict(record) if isinstance(record, dict) else record.to_dict()
+    
+    @staticmethod
+    def _as_record(record_type, data: Dict):
+        """
+        Compact form of a cached payload for the in-memory cache
+        
+        Payloads saved through the Database API may lack record fields or
+        carry extra ones; those are kept as dicts so they are returned as stored.
+        """
+        if data.keys() == set(record_type.__slots__):
+            return record_type.from_dict(data)
+        return data
+    
+    def _recall_many(self, cache_keys, db_lookup, record_type) -> Dict[str, Dict]:
+        """Look keys up in memory first, then in one batched database query"""
+        cached = {}
+        for key in cache_keys:
+            data = self._recall(key)
+            if data is not None:
+                cached[key] = data
+        
+        missing_keys = [key for key in cache_keys if key not in cached]
+        if missing_keys:
+            for key, data in db_lookup(missing_keys).items():
+                self._remember(key, self._as_record(record_type, data))
+                cached[key] = data
+        
+        return cached
+    
+    def _remember(self, cache_key: str, record):
+        """
+        Add a JobPosting or Profile to the in-memory cache
+        
+        Entries are kept as slotted records rather than dicts to keep the
+        cache small (see _as_record for the exceptions); the oldest entry is
+        evicted when it is full.
+        """
+        # Expire together with the SQLite entry, counted from the scrape time
+        ttl = self.config.CACHE_EXPIRY_DAYS * 86400
+        scraped_at = record.get('scraped_at') if isinstance(record, dict) else record.scraped_at
+        if scraped_at:
+            try:
+                ttl -= (datetime.now() - datetime.fromisoformat(scraped_at)).total_seconds()
+            except (TypeError, ValueError):
+                pass  # Not an ISO timestamp - keep the full TTL
+        
+        with self._mem_cache_lock:
+            self._mem_cache[cache_key] = (time.monotonic() + ttl, record)
+            self._mem_cache.move_to_end(cache_key)
+            if len(self._mem_cache) > self.MEM_CACHE_MAX:
+                self._mem_cache.popitem(last=False)
+    
+    def _record_cache_lookup(self, hits: int = 0, misses: int = 0):
+        """Update this session's cache hit/miss counters"""
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
+    
     def get_cache_stats(self) -> Dict:
-        """Get cache statistics"""
-        return self.db.get_cache_stats()
+        """Get cache statistics, including this session's hit rate"""
+        stats = self.db.get_cache_stats()
+        
+        with self._stats_lock:
+            hits, misses = self._hits, self._misses
+        
+        stats.update({
+            'session_hits': hits,
+            'session_misses': misses,
+            'session_hit_rate': calculate_cache_hit_rate(hits + misses, hits)
+        })
+        return stats
     
-    def clear_cache(self, older_than_days: int = None):
-        """Clear cache entries"""
-        self.db.clear_cache(older_than_days)
+    def clear_cache(self, older_than_days: int = None, compact: bool = False):
+        """Clear cache entries (see Database.clear_cache)"""
+        self.db.clear_cache(older_than_days, compact)
+        with self._mem_cache_lock:
+            self._mem_cache.clear()
         logger.info("Cache cleared successfully")
     
     def close(self):
         """Cleanup resources"""
         try:
-            self.driver.quit()
-            self.db.close()
+            self._browser_executor.shutdown(wait=True, cancel_futures=True)
+            self._driver_pool.quit_all()
+            for profile_dir in self._profile_dirs:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            self._profile_dirs.clear()
+            if self.db is not None:
+                release_database(self.db)
+                self.db = None
             logger.info("Crawler closed successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
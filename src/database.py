@@ -4,41 +4,149 @@ Provides quick, structured data retrieval
 """
 
 import sqlite3
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 import os
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Databases shared by crawlers in this process, keyed by (path, expiry days),
+# with the number of crawlers holding each
+_shared_databases: Dict[Tuple[str, int], 'Database'] = {}
+_shared_refs: Dict[Tuple[str, int], int] = {}
+_shared_lock = threading.Lock()
+
 
 class Database:
     """SQLite database manager for caching scraped data"""
     
+    # PRAGMA user_version of the current schema; see _migrate()
+    SCHEMA_VERSION = 5
+    
+    # Searchable columns generated from the payload: column -> key in the data
+    JOB_COLUMNS = {
+        'title': 'title',
+        'company': 'company',
+        'location': 'location',
+        'description': 'description',
+        'posted_date': 'posted_date',
+        'job_type': 'job_type',
+        'seniority_level': 'seniority_level',
+        'job_url': 'url'
+    }
+    PROFILE_COLUMNS = {
+        'name': 'name',
+        'headline': 'headline',
+        'location': 'location',
+        'about': 'about',
+        'connections': 'connections',
+        'profile_url': 'url'
+    }
+    
+    # Re-saving a key updates its row in place (an UPDATE, so the full-text
+    # triggers see it, unlike the DELETE done by INSERT OR REPLACE)
+    UPSERT_SQL = '''
+        ON CONFLICT (cache_key) DO UPDATE
+        SET scraped_at = excluded.scraped_at, data_blob = excluded.data_blob
+    '''
+    
+    # Read-only connections for lookups, opened on demand (file databases only)
+    READER_POOL_SIZE = 4
+    
+    # Keys per IN (...) query in batched lookups
+    MAX_BATCH_PARAMS = 500
+    
+    # Single-key lookups, identical text on every call so sqlite3 reuses the
+    # compiled statement from its cache
+    GET_JOB_SQL = 'SELECT data_blob FROM jobs WHERE cache_key = ? AND scraped_at > ?'
+    GET_PROFILE_SQL = 'SELECT data_blob FROM profiles WHERE cache_key = ? AND scraped_at > ?'
+    
     def __init__(self, cache_expiry_days: int = 7, db_path: str = 'data/linkedin_cache.db'):
         """
         Initialize database connection
         
         Args:
             cache_expiry_days: Days before cache expires
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, ':memory:', or a
+                'file:' URI (e.g. 'file:cache?mode=memory&cache=shared')
         """
         self.cache_expiry_days = cache_expiry_days
         self.db_path = db_path
+        self._is_uri = db_path.startswith('file:')
+        self._in_memory = db_path == ':memory:' or (self._is_uri and 'mode=memory' in db_path)
+        # All writes go through self.conn, serialized by the lock
+        self._lock = threading.Lock()
         
         # Create data directory if it doesn't exist
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not self._is_uri and not self._in_memory:
+            os.makedirs(db_dir, exist_ok=True)
         
         self.conn = self._create_connection()
         self._create_tables()
+        
+        # WAL lets readers run alongside the writer; in-memory databases are
+        # private to (or table-locked within) one connection, so they read
+        # through the writer instead. Slots start empty (None).
+        self._readers = None
+        if not self._in_memory:
+            self._readers = queue.LifoQueue()
+            for _ in range(self.READER_POOL_SIZE):
+                self._readers.put(None)
+        
+        # Every cache key stored per table, so first-seen URLs are rejected
+        # without a query; an exact set rather than a Bloom filter, as the
+        # keys of a local cache fit comfortably in memory
+        self._known_keys = {'jobs': set(), 'profiles': set()}
+        self._load_known_keys()
         logger.info(f"Database initialized at {db_path}")
     
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection (the locked writer for in-memory databases)"""
+        if self._readers is None:
+            with self._lock:
+                yield self.conn
+            return
+        
+        conn = self._readers.get()
+        try:
+            if conn is None:
+                conn = self._create_connection()
+                conn.execute('PRAGMA query_only=ON')
+                # Autocommit: no implicit BEGIN, so no snapshot outlives a read
+                conn.isolation_level = None
+            yield conn
+        finally:
+            # A transaction left open would pin the reader to an old snapshot
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
+    
     def _create_connection(self) -> sqlite3.Connection:
         """Create database connection"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, uri=self._is_uri)
+            
+            # Let deletes hand freed pages back with PRAGMA incremental_vacuum
+            # (only takes effect on a new database, so it must come first)
+            conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            
+            # WAL + NORMAL sync: commits append to the log without an fsync
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            # 64 MB page cache (negative = KiB)
+            conn.execute('PRAGMA cache_size=-65536')
+            # 256 MB of memory-mapped I/O - only meaningful for a file
+            if not self._in_memory:
+                conn.execute('PRAGMA mmap_size=268435456')
             return conn
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
@@ -48,66 +156,135 @@ class Database:
         """Create database tables if they don't exist"""
         cursor = self.conn.cursor()
         
-        # Jobs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cache_key TEXT UNIQUE NOT NULL,
-                title TEXT,
-                company TEXT,
-                location TEXT,
-                description TEXT,
-                posted_date TEXT,
-                job_type TEXT,
-                seniority_level TEXT,
-                job_url TEXT,
-                scraped_at TIMESTAMP NOT NULL,
-                data_json TEXT NOT NULL,
-                UNIQUE(cache_key)
+        # Only the payload is written; the other columns are generated from it
+        for table, columns in (('jobs', self.JOB_COLUMNS), ('profiles', self.PROFILE_COLUMNS)):
+            generated = ',\n'.join(
+                f'                    {self._generated_column(column, key)}'
+                for column, key in columns.items()
             )
-        ''')
-        
-        # Profiles table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS profiles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cache_key TEXT UNIQUE NOT NULL,
-                name TEXT,
-                headline TEXT,
-                location TEXT,
-                about TEXT,
-                connections TEXT,
-                profile_url TEXT,
-                scraped_at TIMESTAMP NOT NULL,
-                data_json TEXT NOT NULL,
-                UNIQUE(cache_key)
-            )
-        ''')
-        
-        # Create indices for faster lookups
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_jobs_cache_key 
-            ON jobs(cache_key)
-        ''')
-        
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cache_key TEXT UNIQUE NOT NULL,
+                    scraped_at INTEGER NOT NULL,
+                    data_blob BLOB NOT NULL,
+{generated}
+                )
+            ''')
+        
+        # cache_key lookups use the index behind its UNIQUE constraint; these
+        # serve the expiry range queries
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at 
             ON jobs(scraped_at)
         ''')
         
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_profiles_cache_key 
-            ON profiles(cache_key)
-        ''')
-        
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_profiles_scraped_at 
             ON profiles(scraped_at)
         ''')
         
         self.conn.commit()
+        self._migrate()
         logger.info("Database tables created/verified")
     
+    def _migrate(self):
+        """Bring a database created by an older version up to SCHEMA_VERSION"""
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+        
+        with self.conn:
+            # 1: payload stored as orjson bytes in data_blob instead of JSON text in data_json
+            if version < 1:
+                for table in ('jobs', 'profiles'):
+                    columns = {row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+                    if 'data_json' in columns:
+                        self.conn.execute(f'ALTER TABLE {table} ADD COLUMN data_blob BLOB')
+                        self.conn.execute(f'UPDATE {table} SET data_blob = CAST(data_json AS BLOB)')
+                        self.conn.execute(f'ALTER TABLE {table} DROP COLUMN data_json')
+            
+            # 2: scalar columns generated from data_blob instead of written twice
+            if version < 2:
+                for table, columns in (('jobs', self.JOB_COLUMNS), ('profiles', self.PROFILE_COLUMNS)):
+                    # hidden = 0 for an ordinary column, 2/3 for a generated one
+                    plain = {
+                        row[1] for row in self.conn.execute(f'PRAGMA table_xinfo({table})')
+                        if row[6] == 0
+                    }
+                    for column, key in columns.items():
+                        if column in plain:
+                            self.conn.execute(f'ALTER TABLE {table} DROP COLUMN {column}')
+                            self.conn.execute(
+                                f'ALTER TABLE {table} ADD COLUMN {self._generated_column(column, key)}'
+                            )
+            
+            # 3: full-text index over the searchable job columns, kept in sync
+            # by triggers (saves upsert, so replaced rows fire the update one)
+            if version < 3:
+                self.conn.executescript('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                        title, company, location, description,
+                        content='jobs', content_rowid='id'
+                    );
+                    
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                        INSERT INTO jobs_fts (rowid, title, company, location, description)
+                        VALUES (new.id, new.title, new.company, new.location, new.description);
+                    END;
+                    
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                        INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+                        VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+                    END;
+                    
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE ON jobs BEGIN
+                        INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+                        VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+                        INSERT INTO jobs_fts (rowid, title, company, location, description)
+                        VALUES (new.id, new.title, new.company, new.location, new.description);
+                    END;
+                    
+                    INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild');
+                ''')
+            
+            # 4: plain cache_key indexes duplicated the UNIQUE constraint's index
+            if version < 4:
+                self.conn.execute('DROP INDEX IF EXISTS idx_jobs_cache_key')
+                self.conn.execute('DROP INDEX IF EXISTS idx_profiles_cache_key')
+            
+            # 5: scraped_at as integer Unix seconds instead of local datetime text
+            if version < 5:
+                for table in ('jobs', 'profiles'):
+                    self.conn.execute(f'''
+                        UPDATE {table}
+                        SET scraped_at = CAST(strftime('%s', scraped_at, 'utc') AS INTEGER)
+                        WHERE typeof(scraped_at) = 'text'
+                    ''')
+            
+            self.conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        
+        logger.info(f"Database schema migrated from version {version} to {self.SCHEMA_VERSION}")
+    
+    @staticmethod
+    def _cutoff(days: int) -> int:
+        """Unix time `days` days ago; rows scraped at or before it are expired"""
+        return int(time.time()) - days * 86400
+    
+    @staticmethod
+    def _generated_column(column: str, key: str) -> str:
+        """Definition of a column computed from one key of the payload"""
+        return (
+            f"{column} TEXT GENERATED ALWAYS AS "
+            f"(json_extract(CAST(data_blob AS TEXT), '$.{key}')) VIRTUAL"
+        )
+    
+    def _load_known_keys(self):
+        """Rebuild the in-memory key sets from the tables"""
+        for table, keys in self._known_keys.items():
+            keys.clear()
+            keys.update(key for (key,) in self.conn.execute(f'SELECT cache_key FROM {table}'))
+    
     def get_cached_job(self, cache_key: str) -> Optional[Dict]:
         """
         Retrieve cached job data if not expired
@@ -118,22 +295,21 @@ class Database:
         Returns:
             Dict with job data or None if not found/expired
         """
-        cursor = self.conn.cursor()
-        expiry_date = datetime.now() - timedelta(days=self.cache_expiry_days)
-        
-        cursor.execute('''
-            SELECT data_json FROM jobs
-            WHERE cache_key = ? AND scraped_at > ?
-        ''', (cache_key, expiry_date))
+        if cache_key not in self._known_keys['jobs']:
+            logger.debug("Cache miss for job key: %s", cache_key)
+            return None
         
-        result = cursor.fetchone()
+        expiry_date = self._cutoff(self.cache_expiry_days)
         
-        if result:
-            logger.debug(f"Cache hit for job key: {cache_key}")
-            return json.loads(result['data_json'])
-        
-        logger.debug(f"Cache miss for job key: {cache_key}")
-        return None
+        with self._reader() as conn:
+            result = conn.execute(self.GET_JOB_SQL, (cache_key, expiry_date)).fetchone()
+            
+            if result:
+                logger.debug("Cache hit for job key: %s", cache_key)
+                return orjson.loads(result[0])
+            
+            logger.debug("Cache miss for job key: %s", cache_key)
+            return None
     
     def get_cached_profile(self, cache_key: str) -> Optional[Dict]:
         """
@@ -145,22 +321,77 @@ class Database:
         Returns:
             Dict with profile data or None if not found/expired
         """
-        cursor = self.conn.cursor()
-        expiry_date = datetime.now() - timedelta(days=self.cache_expiry_days)
+        if cache_key not in self._known_keys['profiles']:
+            logger.debug("Cache miss for profile key: %s", cache_key)
+            return None
         
-        cursor.execute('''
-            SELECT data_json FROM profiles
-            WHERE cache_key = ? AND scraped_at > ?
-        ''', (cache_key, expiry_date))
+        expiry_date = self._cutoff(self.cache_expiry_days)
         
-        result = cursor.fetchone()
+        with self._reader() as conn:
+            result = conn.execute(self.GET_PROFILE_SQL, (cache_key, expiry_date)).fetchone()
+            
+            if result:
+                logger.debug("Cache hit for profile key: %s", cache_key)
+                return orjson.loads(result[0])
+            
+            logger.debug("Cache miss for profile key: %s", cache_key)
+            return None
+    
+    def get_cached_jobs(self, cache_keys: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve several cached jobs with batched queries
         
-        if result:
-            logger.debug(f"Cache hit for profile key: {cache_key}")
-            return json.loads(result['data_json'])
+        Args:
+            cache_keys: Cache keys to look up
+            
+        Returns:
+            Dict mapping cache key to job data for every non-expired hit
+        """
+        return self._get_cached_many('jobs', cache_keys)
+    
+    def get_cached_profiles(self, cache_keys: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve several cached profiles with batched queries
         
-        logger.debug(f"Cache miss for profile key: {cache_key}")
-        return None
+        Args:
+            cache_keys: Cache keys to look up
+            
+        Returns:
+            Dict mapping cache key to profile data for every non-expired hit
+        """
+        return self._get_cached_many('profiles', cache_keys)
+    
+    def _get_cached_many(self, table: str, cache_keys: List[str]) -> Dict[str, Dict]:
+        """Look up cache keys in `table` using one IN (...) query per chunk"""
+        results = {}
+        expiry_date = self._cutoff(self.cache_expiry_days)
+        
+        # Keys never stored cannot hit; only the rest go to SQLite
+        known = self._known_keys[table]
+        lookup_keys = [key for key in cache_keys if key in known]
+        
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(lookup_keys), self.MAX_BATCH_PARAMS):
+                chunk = lookup_keys[start:start + self.MAX_BATCH_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    SELECT cache_key, data_blob FROM {table}
+                    WHERE cache_key IN ({placeholders}) AND scraped_at > ?
+                ''', (*chunk, expiry_date))
+                
+                for cache_key, data_blob in cursor.fetchall():
+                    results[cache_key] = orjson.loads(data_blob)
+        
+        logger.debug("Batch cache lookup on %s: %s/%s hits", table, len(results), len(cache_keys))
+        return results
+    
+    @staticmethod
+    def _row(cache_key: str, data: Dict, scraped_at: int) -> tuple:
+        """Column values for one jobs or profiles row"""
+        return (cache_key, scraped_at, orjson.dumps(data))
     
     def save_job(self, cache_key: str, job_data: Dict):
         """
@@ -170,36 +401,7 @@ class Database:
             cache_key: Unique cache key
             job_data: Job data dictionary
         """
-        cursor = self.conn.cursor()
-        data_json = json.dumps(job_data, ensure_ascii=False)
-        
-        try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO jobs 
-                (cache_key, title, company, location, description, 
-                 posted_date, job_type, seniority_level, job_url, 
-                 scraped_at, data_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                cache_key,
-                job_data.get('title'),
-                job_data.get('company'),
-                job_data.get('location'),
-                job_data.get('description'),
-                job_data.get('posted_date'),
-                job_data.get('job_type'),
-                job_data.get('seniority_level'),
-                job_data.get('url'),
-                datetime.now(),
-                data_json
-            ))
-            
-            self.conn.commit()
-            logger.debug(f"Job data cached with key: {cache_key}")
-            
-        except sqlite3.Error as e:
-            logger.error(f"Failed to save job to cache: {e}")
-            self.conn.rollback()
+        self.save_jobs([(cache_key, job_data)])
     
     def save_profile(self, cache_key: str, profile_data: Dict):
         """
@@ -209,33 +411,97 @@ class Database:
             cache_key: Unique cache key
             profile_data: Profile data dictionary
         """
-        cursor = self.conn.cursor()
-        data_json = json.dumps(profile_data, ensure_ascii=False)
+        self.save_profiles([(cache_key, profile_data)])
+    
+    def save_jobs(self, items: List[Tuple[str, Dict]]):
+        """
+        Save several jobs to cache in one transaction
         
-        try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO profiles 
-                (cache_key, name, headline, location, about, 
-                 connections, profile_url, scraped_at, data_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                cache_key,
-                profile_data.get('name'),
-                profile_data.get('headline'),
-                profile_data.get('location'),
-                profile_data.get('about'),
-                profile_data.get('connections'),
-                profile_data.get('url'),
-                datetime.now(),
-                data_json
-            ))
-            
-            self.conn.commit()
-            logger.debug(f"Profile data cached with key: {cache_key}")
-            
-        except sqlite3.Error as e:
-            logger.error(f"Failed to save profile to cache: {e}")
-            self.conn.rollback()
+        Args:
+            items: (cache_key, job_data) pairs
+        """
+        self._save_many('jobs', items)
+    
+    def save_profiles(self, items: List[Tuple[str, Dict]]):
+        """
+        Save several profiles to cache in one transaction
+        
+        Args:
+            items: (cache_key, profile_data) pairs
+        """
+        self._save_many('profiles', items)
+    
+    def _save_many(self, table: str, items: List[Tuple[str, Dict]]):
+        """Write (cache_key, data) pairs to `table` with one executemany"""
+        if not items:
+            return
+        
+        scraped_at = int(time.time())
+        rows = [self._row(key, data, scraped_at) for key, data in items]
+        
+        with self._lock:
+            try:
+                with self.conn:
+                    self.conn.executemany(f'''
+                        INSERT INTO {table} (cache_key, scraped_at, data_blob)
+                        VALUES (?, ?, ?)
+                        {self.UPSERT_SQL}
+                    ''', rows)
+                self._known_keys[table].update(key for key, _ in items)
+                logger.debug("Cached %s %s in one batch", len(rows), table)
+                
+            except sqlite3.Error as e:
+                logger.error(f"Failed to save {table} to cache: {e}")
+    
+    def bulk_import_jobs(self, items: List[Tuple[str, Dict]]):
+        """
+        Import a very large batch of jobs with a single statement
+        
+        The batch is bound as one JSON parameter and expanded by SQLite's
+        json_each, so there is no per-row parameter binding and no limit on
+        the batch size.
+        
+        Args:
+            items: (cache_key, job_data) pairs
+        """
+        self._bulk_import('jobs', items)
+    
+    def bulk_import_profiles(self, items: List[Tuple[str, Dict]]):
+        """
+        Import a very large batch of profiles with a single statement
+        
+        Args:
+            items: (cache_key, profile_data) pairs
+        """
+        self._bulk_import('profiles', items)
+    
+    def _bulk_import(self, table: str, items: List[Tuple[str, Dict]]):
+        """Run a json_each import statement over (cache_key, data) pairs"""
+        if not items:
+            return
+        
+        params = {
+            'items': orjson.dumps(items).decode(),
+            'scraped_at': int(time.time())
+        }
+        
+        with self._lock:
+            try:
+                with self.conn:
+                    self.conn.execute(f'''
+                        INSERT INTO {table} (cache_key, scraped_at, data_blob)
+                        SELECT json_extract(value, '$[0]'),
+                               :scraped_at,
+                               CAST(json_extract(value, '$[1]') AS BLOB)
+                        FROM json_each(:items)
+                        WHERE true
+                        {self.UPSERT_SQL}
+                    ''', params)
+                self._known_keys[table].update(key for key, _ in items)
+                logger.info(f"Imported {len(items)} {table}")
+                
+            except sqlite3.Error as e:
+                logger.error(f"Failed to import {table}: {e}")
     
     def get_cache_stats(self) -> Dict:
         """
@@ -244,77 +510,91 @@ class Database:
         Returns:
             Dict with cache statistics
         """
-        cursor = self.conn.cursor()
-        
-        # Total jobs
-        cursor.execute('SELECT COUNT(*) as count FROM jobs')
-        total_jobs = cursor.fetchone()['count']
-        
-        # Total profiles
-        cursor.execute('SELECT COUNT(*) as count FROM profiles')
-        total_profiles = cursor.fetchone()['count']
-        
-        # Expired jobs
-        expiry_date = datetime.now() - timedelta(days=self.cache_expiry_days)
-        cursor.execute('SELECT COUNT(*) as count FROM jobs WHERE scraped_at <= ?', (expiry_date,))
-        expired_jobs = cursor.fetchone()['count']
-        
-        # Expired profiles
-        cursor.execute('SELECT COUNT(*) as count FROM profiles WHERE scraped_at <= ?', (expiry_date,))
-        expired_profiles = cursor.fetchone()['count']
-        
-        # Database size
-        cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-        db_size = cursor.fetchone()['size']
-        
-        return {
-            'total_jobs': total_jobs,
-            'total_profiles': total_profiles,
-            'expired_jobs': expired_jobs,
-            'expired_profiles': expired_profiles,
-            'valid_jobs': total_jobs - expired_jobs,
-            'valid_profiles': total_profiles - expired_profiles,
-            'database_size_mb': round(db_size / (1024 * 1024), 2),
-            'cache_expiry_days': self.cache_expiry_days
-        }
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            
+            # Total and expired rows per table, one pass each over the
+            # scraped_at index (it covers both counts and is far smaller than
+            # the table or the cache_key index)
+            expiry_date = self._cutoff(self.cache_expiry_days)
+            counts_sql = '''
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE scraped_at <= ?)
+                FROM {table} INDEXED BY idx_{table}_scraped_at
+            '''
+            total_jobs, expired_jobs = cursor.execute(
+                counts_sql.format(table='jobs'), (expiry_date,)
+            ).fetchone()
+            total_profiles, expired_profiles = cursor.execute(
+                counts_sql.format(table='profiles'), (expiry_date,)
+            ).fetchone()
+            
+            # Database size
+            cursor.execute("SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()")
+            db_size = cursor.fetchone()[0]
+            
+            return {
+                'total_jobs': total_jobs,
+                'total_profiles': total_profiles,
+                'expired_jobs': expired_jobs,
+                'expired_profiles': expired_profiles,
+                'valid_jobs': total_jobs - expired_jobs,
+                'valid_profiles': total_profiles - expired_profiles,
+                'database_size_mb': round(db_size / (1024 * 1024), 2),
+                'cache_expiry_days': self.cache_expiry_days
+            }
     
-    def clear_cache(self, older_than_days: int = None):
+    def clear_cache(self, older_than_days: int = None, compact: bool = False):
         """
         Clear cache entries
         
+        Freed pages are released with an incremental vacuum rather than a
+        full rewrite of the database.
+        
         Args:
             older_than_days: Clear entries older than specified days (None = clear all)
+            compact: Also run a full VACUUM after clearing everything (this also
+                enables incremental vacuum on databases created without it)
         """
-        cursor = self.conn.cursor()
-        
-        try:
-            if older_than_days is None:
-                # Clear all cache
-                cursor.execute('DELETE FROM jobs')
-                cursor.execute('DELETE FROM profiles')
-                logger.info("All cache cleared")
-            else:
-                # Clear expired cache
-                expiry_date = datetime.now() - timedelta(days=older_than_days)
-                cursor.execute('DELETE FROM jobs WHERE scraped_at <= ?', (expiry_date,))
-                jobs_deleted = cursor.rowcount
-                cursor.execute('DELETE FROM profiles WHERE scraped_at <= ?', (expiry_date,))
-                profiles_deleted = cursor.rowcount
-                logger.info(f"Cleared {jobs_deleted} jobs and {profiles_deleted} profiles older than {older_than_days} days")
-            
-            self.conn.commit()
-            
-            # Vacuum to reclaim space
-            cursor.execute('VACUUM')
+        with self._lock:
+            cursor = self.conn.cursor()
             
-        except sqlite3.Error as e:
-            logger.error(f"Failed to clear cache: {e}")
-            self.conn.rollback()
+            try:
+                if older_than_days is None:
+                    # Clear all cache
+                    cursor.execute('DELETE FROM jobs')
+                    cursor.execute('DELETE FROM profiles')
+                    logger.info("All cache cleared")
+                else:
+                    # Clear expired cache
+                    expiry_date = self._cutoff(older_than_days)
+                    cursor.execute('DELETE FROM jobs WHERE scraped_at <= ?', (expiry_date,))
+                    jobs_deleted = cursor.rowcount
+                    cursor.execute('DELETE FROM profiles WHERE scraped_at <= ?', (expiry_date,))
+                    profiles_deleted = cursor.rowcount
+                    logger.info(f"Cleared {jobs_deleted} jobs and {profiles_deleted} profiles older than {older_than_days} days")
+                
+                self.conn.commit()
+                self._load_known_keys()
+                
+                # Release the freed pages
+                if compact and older_than_days is None:
+                    cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                    cursor.execute('VACUUM')
+                else:
+                    # Frees one page per step; executescript steps it to completion
+                    self.conn.executescript('PRAGMA incremental_vacuum')
+                
+            except sqlite3.Error as e:
+                logger.error(f"Failed to clear cache: {e}")
+                self.conn.rollback()
     
     def search_jobs(self, keyword: str = None, company: str = None, location: str = None, limit: int = 10) -> list:
         """
         Search cached jobs by keyword, company, or location
         
+        Uses the full-text index, so each filter matches whole words (all of
+        them, in order) rather than arbitrary substrings.
+        
         Args:
             keyword: Search in title and description
             company: Search by company name
@@ -322,65 +602,117 @@ class Database:
             limit: Maximum results to return
             
         Returns:
-            List of job dictionaries
+            List of job dictionaries, best matches first (newest first
+            without filters)
         """
-        cursor = self.conn.cursor()
-        
-        query = 'SELECT data_json FROM jobs WHERE 1=1'
-        params = []
-        
-        if keyword:
-            query += ' AND (title LIKE ? OR description LIKE ?)'
-            params.extend([f'%{keyword}%', f'%{keyword}%'])
-        
-        if company:
-            query += ' AND company LIKE ?'
-            params.append(f'%{company}%')
-        
-        if location:
-            query += ' AND location LIKE ?'
-            params.append(f'%{location}%')
-        
-        query += ' ORDER BY scraped_at DESC LIMIT ?'
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        
-        return [json.loads(row['data_json']) for row in results]
+        terms = []
+        for columns, value in (('{title description}', keyword), ('company', company), ('location', location)):
+            if value:
+                # A quoted FTS5 phrase; embedded quotes are doubled
+                phrase = value.replace('"', '""')
+                terms.append(f'{columns}: "{phrase}"')
+        
+        with self._reader() as conn:
+            if terms:
+                cursor = conn.execute('''
+                    SELECT jobs.data_blob FROM jobs_fts
+                    JOIN jobs ON jobs.id = jobs_fts.rowid
+                    WHERE jobs_fts MATCH ?
+                    ORDER BY jobs_fts.rank
+                    LIMIT ?
+                ''', (' AND '.join(terms), limit))
+            else:
+                cursor = conn.execute(
+                    'SELECT data_blob FROM jobs ORDER BY scraped_at DESC LIMIT ?', (limit,)
+                )
+            
+            return [orjson.loads(row[0]) for row in cursor.fetchall()]
     
     def export_to_json(self, output_file: str = 'export.json'):
         """
         Export all cached data to JSON file
         
+        Stored payloads are already JSON, so rows are streamed to the file
+        as-is (one record per line) without being decoded.
+        
         Args:
             output_file: Output file path
         """
-        cursor = self.conn.cursor()
-        
-        # Get all jobs
-        cursor.execute('SELECT data_json FROM jobs')
-        jobs = [json.loads(row['data_json']) for row in cursor.fetchall()]
-        
-        # Get all profiles
-        cursor.execute('SELECT data_json FROM profiles')
-        profiles = [json.loads(row['data_json']) for row in cursor.fetchall()]
-        
-        export_data = {
-            'export_date': datetime.now().isoformat(),
-            'total_jobs': len(jobs),
-            'total_profiles': len(profiles),
-            'jobs': jobs,
-            'profiles': profiles
-        }
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"Data exported to {output_file}")
+        with self._reader() as conn:
+            # One read transaction, so the counts match the rows written
+            conn.execute('BEGIN')
+            try:
+                header = {
+                    'export_date': datetime.now().isoformat(),
+                    'total_jobs': conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0],
+                    'total_profiles': conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+                }
+                
+                with open(output_file, 'wb') as f:
+                    # Header fields, then the record arrays written into the object
+                    f.write(orjson.dumps(header)[:-1])
+                    for table in ('jobs', 'profiles'):
+                        f.write(f',\n"{table}": [\n'.encode())
+                        cursor = conn.execute(f'SELECT data_blob FROM {table}')
+                        for i, (data_blob,) in enumerate(cursor):
+                            if i:
+                                f.write(b',\n')
+                            f.write(data_blob)
+                        f.write(b'\n]')
+                    f.write(b'}\n')
+            finally:
+                conn.execute('COMMIT')
+            
+            logger.info(f"Data exported to {output_file}")
     
     def close(self):
         """Close database connection"""
+        if self._readers is not None:
+            while not self._readers.empty():
+                reader = self._readers.get_nowait()
+                if reader is not None:
+                    reader.close()
+        
         if self.conn:
             self.conn.close()
-            logger.info("Database connection closed")
\ No newline at end of file
+            logger.info("Database connection closed")
+
+
+def acquire_database(db_path: str, cache_expiry_days: int) -> Database:
+    """
+    Get the process-wide Database for a path and expiry, opening it on first use
+    
+    Every call must be paired with release_database().
+    
+    Args:
+        db_path: Path to SQLite database file
+        cache_expiry_days: Days before cache expires
+        
+    Returns:
+        Shared Database instance
+    """
+    key = (db_path, cache_expiry_days)
+    with _shared_lock:
+        db = _shared_databases.get(key)
+        if db is None:
+            db = _shared_databases[key] = Database(cache_expiry_days, db_path)
+        _shared_refs[key] = _shared_refs.get(key, 0) + 1
+        return db
+
+
+def release_database(db: Database):
+    """
+    Drop one reference to a shared Database, closing it with the last one
+    
+    Args:
+        db: Instance returned by acquire_database()
+    """
+    key = (db.db_path, db.cache_expiry_days)
+    with _shared_lock:
+        if _shared_databases.get(key) is not db:
+            return
+        
+        _shared_refs[key] -= 1
+        if _shared_refs[key] == 0:
+            del _shared_databases[key], _shared_refs[key]
+            db.close()
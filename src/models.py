@@ -0,0 +1,54 @@
+"""
+Record types for scraped data
+
+The crawler keeps these slotted records in its in-memory cache and converts
+them to plain dicts only when handing data out or writing it to SQLite.
+"""
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(slots=True)
+class JobPosting:
+    """Fields scraped from one job posting ('N/A' when not found)"""
+
+    url: str = ''
+    scraped_at: str = ''
+    title: str = 'N/A'
+    company: str = 'N/A'
+    location: str = 'N/A'
+    description: str = 'N/A'
+    posted_date: str = 'N/A'
+    job_type: str = 'N/A'
+    seniority_level: str = 'N/A'
+
+    def to_dict(self) -> Dict[str, str]:
+        """Plain dict form, as stored in SQLite and returned by the crawler"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]):
+        """Build a record from its dict form (unknown keys are ignored)"""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+@dataclass(slots=True)
+class Profile:
+    """Fields scraped from one profile ('N/A' when not found)"""
+
+    url: str = ''
+    scraped_at: str = ''
+    name: str = 'N/A'
+    headline: str = 'N/A'
+    location: str = 'N/A'
+    about: str = 'N/A'
+    connections: str = 'N/A'
+
+    def to_dict(self) -> Dict[str, str]:
+        """Plain dict form, as stored in SQLite and returned by the crawler"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]):
+        """Build a record from its dict form (unknown keys are ignored)"""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
@@ -0,0 +1,31 @@
+"""
+Runtime module - process-wide crawler instance
+Lets several scripts in one process share a browser and cache connection
+"""
+
+import atexit
+from functools import lru_cache
+
+from .config import get_config
+from .crawler import LinkedInCrawler
+
+
+@lru_cache(maxsize=1)
+def get_crawler() -> LinkedInCrawler:
+    """
+    Get the process-wide crawler
+    
+    Returns:
+        Shared LinkedInCrawler (built on first call, closed at exit)
+    """
+    return LinkedInCrawler(get_config())
+
+
+def close_crawler():
+    """Close the shared crawler if one was created"""
+    if get_crawler.cache_info().currsize:
+        get_crawler().close()
+        get_crawler.cache_clear()
+
+
+atexit.register(close_crawler)
@@ -1,20 +1,113 @@
-import hashlib
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import sys
 from datetime import datetime
+from functools import lru_cache
+from typing import List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import xxhash
 
+# Query parameters that identify content; everything else is tracking noise
+_KEPT_QUERY_PARAMS = frozenset({'currentJobId'})
+
+# LinkedIn URL patterns, compiled once at import
+_JOB_URL_RE = re.compile(
+    r'^(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/jobs/view/[^/?#]+/?(?:[?#].*)?$',
+    re.IGNORECASE
+)
+_PROFILE_URL_RE = re.compile(
+    r'^(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[^/?#]+/?(?:[?#].*)?$',
+    re.IGNORECASE
+)
+_URL_PATTERNS = {
+    'job': _JOB_URL_RE,
+    'profile': _PROFILE_URL_RE
+}
+
+# Unanchored variants for pulling absolute URLs out of free text
+_URL_SCAN_PATTERNS = {
+    'job': re.compile(
+        r'https?://(?:[a-z]{2,3}\.)?linkedin\.com/jobs/view/[^/?#\s"\'<>,)]+/?',
+        re.IGNORECASE
+    ),
+    'profile': re.compile(
+        r'https?://(?:[a-z]{2,3}\.)?linkedin\.com/in/[^/?#\s"\'<>,)]+/?',
+        re.IGNORECASE
+    )
+}
+
+# ID segment following /jobs/view/ or /in/ anywhere in a URL
+_JOB_ID_RE = re.compile(r'/jobs/view/([^/?#]+)')
+_PROFILE_ID_RE = re.compile(r'/in/([^/?#]+)')
+
+# Runs of whitespace (spaces, tabs, newlines, Unicode spaces)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Application banner, encoded once for the console at import
+_BANNER = """
+    ╔═══════════════════════════════════════════════════════════╗
+    ║                                                           ║
+    ║         LinkedIn Selenium Crawler v1.0                    ║
+    ║         Automated Job & Profile Data Extraction           ║
+    ║                                                           ║
+    ║         Features:                                         ║
+    ║         ✓ SQLite Caching                                  ║
+    ║         ✓ Retry Logic (30% Reliability Boost)             ║
+    ║         ✓ Custom Wait Strategies                          ║
+    ║         ✓ Structured Error Handling                       ║
+    ║                                                           ║
+    ╚═══════════════════════════════════════════════════════════╝
+    """
+_BANNER_BYTES = (_BANNER + '\n').encode(
+    getattr(sys.stdout, 'encoding', None) or 'utf-8',
+    errors='replace'
+)
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a LinkedIn URL so equivalent links share one cache entry
+    
+    Drops tracking query parameters (trk, refId, ...), the fragment and any
+    trailing slash, and lower-cases the scheme and host. Results are memoized
+    since the same URL is canonicalized for cache keys and de-duplication.
+    
+    Args:
+        url: URL to normalize
+        
+    Returns:
+        Canonical URL string
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query)
+        if key in _KEPT_QUERY_PARAMS
+    ])
+    path = parts.path.rstrip('/') or '/'
+    
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+@lru_cache(maxsize=8192)
 def generate_cache_key(url: str) -> str:
     """
-    Generate unique cache key from URL using MD5 hash
+    Generate unique cache key from the canonical URL using xxh3-128
+    
+    Memoized: the same URL is keyed again on every search -> scrape hop.
     
     Args:
         url: URL to generate key from
         
     Returns:
-        MD5 hash as cache key
+        32-character hex digest as cache key
     """
-    return hashlib.md5(url.encode()).hexdigest()
+    return xxhash.xxh3_128_hexdigest(canonicalize_url(url).encode())
 
 
 def setup_logging(log_level: str = 'INFO', log_file: str = 'logs/crawler.log'):
@@ -28,16 +121,40 @@ def setup_logging(log_level: str = 'INFO', log_file: str = 'logs/crawler.log'):
     # Create logs directory if it doesn't exist
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
     
-    # Configure logging
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    
+    # Console output goes to stderr; when stdout is not a terminal (piped or
+    # driven by another process) only warnings and errors are echoed there,
+    # the full log still lands in the log file
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    if not sys.stdout.isatty():
+        stream_handler.setLevel(logging.WARNING)
+    
+    # Scraping threads only enqueue records; one listener thread does the
+    # file and console writes
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Only the message is merged here; the listener's handlers add the rest
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
+        handlers=[queue_handler]
     )
     
+    if queue_handler in logging.getLogger().handlers:
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        listener.start()
+        # Drain queued records before the interpreter exits
+        atexit.register(listener.stop)
+    else:
+        # Logging was already configured; basicConfig left it untouched
+        file_handler.close()
+    
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
 
@@ -73,16 +190,8 @@ def clean_text(text: str) -> str:
     if not text or text == 'N/A':
         return text
     
-    # Remove multiple spaces
-    text = ' '.join(text.split())
-    
-    # Remove newlines and tabs
-    text = text.replace('\n', ' ').replace('\t', ' ')
-    
-    # Remove multiple spaces again
-    text = ' '.join(text.split())
-    
-    return text.strip()
+    # Collapse every whitespace run (newlines and tabs included) in one pass
+    return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 def validate_url(url: str, url_type: str = 'job') -> bool:
@@ -99,12 +208,34 @@ def validate_url(url: str, url_type: str = 'job') -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    if url_type == 'job':
-        return 'linkedin.com/jobs/view/' in url
-    elif url_type == 'profile':
-        return 'linkedin.com/in/' in url
+    pattern = _URL_PATTERNS.get(url_type)
+    if pattern is None:
+        return False
+    
+    return pattern.match(url) is not None
+
+
+def find_urls(text: str, url_type: str = 'profile') -> List[str]:
+    """
+    Extract LinkedIn URLs from a block of text in a single regex pass
+    
+    Args:
+        text: Text to scan (e.g. the contents of a file)
+        url_type: Type of URL ('job' or 'profile')
+        
+    Returns:
+        Unique URLs in order of first appearance (links that canonicalize
+        to the same URL are returned once, as first written)
+    """
+    pattern = _URL_SCAN_PATTERNS.get(url_type)
+    if pattern is None or not text:
+        return []
+    
+    urls = {}
+    for url in pattern.findall(text):
+        urls.setdefault(canonicalize_url(url), url)
     
-    return False
+    return list(urls.values())
 
 
 def extract_job_id(job_url: str) -> str:
@@ -117,16 +248,8 @@ def extract_job_id(job_url: str) -> str:
     Returns:
         Job ID or empty string if not found
     """
-    try:
-        if '/jobs/view/' in job_url:
-            parts = job_url.split('/jobs/view/')
-            if len(parts) > 1:
-                job_id = parts[1].split('/')[0].split('?')[0]
-                return job_id
-    except:
-        pass
-    
-    return ''
+    match = _JOB_ID_RE.search(job_url)
+    return match.group(1) if match else ''
 
 
 def extract_profile_id(profile_url: str) -> str:
@@ -139,16 +262,8 @@ def extract_profile_id(profile_url: str) -> str:
     Returns:
         Profile ID or empty string if not found
     """
-    try:
-        if '/in/' in profile_url:
-            parts = profile_url.split('/in/')
-            if len(parts) > 1:
-                profile_id = parts[1].split('/')[0].split('?')[0]
-                return profile_id
-    except:
-        pass
-    
-    return ''
+    match = _PROFILE_ID_RE.search(profile_url)
+    return match.group(1) if match else ''
 
 
 def create_project_structure():
@@ -175,21 +290,15 @@ def create_project_structure():
 
 def print_banner():
     """Print application banner"""
-    banner = """
-    ╔═══════════════════════════════════════════════════════════╗
-    ║                                                           ║
-    ║         LinkedIn Selenium Crawler v1.0                    ║
-    ║         Automated Job & Profile Data Extraction           ║
-    ║                                                           ║
-    ║         Features:                                         ║
-    ║         ✓ SQLite Caching                                  ║
-    ║         ✓ Retry Logic (30% Reliability Boost)             ║
-    ║         ✓ Custom Wait Strategies                          ║
-    ║         ✓ Structured Error Handling                       ║
-    ║                                                           ║
-    ╚═══════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        # Text-only stdout (e.g. captured by an IDE)
+        print(_BANNER)
+        return
+    
+    sys.stdout.flush()
+    stream.write(_BANNER_BYTES)
+    stream.flush()
 
 
 def calculate_cache_hit_rate(total_requests: int, cache_hits: int) -> float:
@@ -4,17 +4,29 @@ Test suite for LinkedIn Crawler
 import unittest
 import sys
 import os
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.crawler import LinkedInCrawler
+from selectolax.lexbor import LexborHTMLParser
+
+from src.crawler import LinkedInCrawler, TokenBucket, _profile_from_embedded_json
 from src.database import Database
 from src.config import Config
+from src.models import JobPosting
 from src.utils import (
     generate_cache_key,
     validate_url,
     extract_job_id,
     extract_profile_id,
+    find_urls,
     clean_text
 )
 
@@ -31,8 +43,15 @@ class TestUtils(unittest.TestCase):
         # Same URL should produce same key
         self.assertEqual(key1, key2)
         
-        # Key should be 32 characters (MD5 hash)
+        # Key should be 32 characters (128-bit hash)
         self.assertEqual(len(key1), 32)
+        
+        # Tracking parameters and trailing slashes should not change the key
+        self.assertEqual(
+            key1,
+            generate_cache_key(url + "/?trk=public_jobs&refId=abc123")
+        )
+        self.assertNotEqual(key1, generate_cache_key(url.replace('12345', '54321')))
     
     def test_validate_url(self):
         """Test URL validation"""
@@ -48,11 +67,35 @@ class TestUtils(unittest.TestCase):
             'profile'
         ))
         
+        # Tracking parameters and trailing slashes are allowed
+        self.assertTrue(validate_url(
+            'https://www.linkedin.com/in/john-doe/?originalSubdomain=uk',
+            'profile'
+        ))
+        
         # Invalid URLs
         self.assertFalse(validate_url('invalid-url', 'job'))
+        self.assertFalse(validate_url('https://example.com/?next=linkedin.com/in/x', 'profile'))
+        self.assertFalse(validate_url('https://www.linkedin.com/in/john-doe', 'job'))
         self.assertFalse(validate_url('', 'job'))
         self.assertFalse(validate_url(None, 'job'))
     
+    def test_find_urls(self):
+        """Test bulk URL extraction from text"""
+        text = (
+            "https://www.linkedin.com/in/john-doe/?trk=x\n"
+            "not a url\n"
+            "see https://uk.linkedin.com/in/jane-roe, "
+            "https://www.linkedin.com/in/john-doe/\n"
+            "https://WWW.linkedin.com/in/john-doe\n"
+        )
+        
+        self.assertEqual(find_urls(text, 'profile'), [
+            'https://www.linkedin.com/in/john-doe/',
+            'https://uk.linkedin.com/in/jane-roe'
+        ])
+        self.assertEqual(find_urls(text, 'job'), [])
+    
     def test_extract_job_id(self):
         """Test job ID extraction"""
         url = "https://www.linkedin.com/jobs/view/3812345678"
@@ -83,16 +126,19 @@ class TestUtils(unittest.TestCase):
 class TestDatabase(unittest.TestCase):
     """Test database operations"""
     
-    def setUp(self):
-        """Setup test database"""
-        self.test_db_path = 'test_cache.db'
-        self.db = Database(cache_expiry_days=7, db_path=self.test_db_path)
+    @classmethod
+    def setUpClass(cls):
+        """Setup in-memory test database once for the class"""
+        cls.db = Database(cache_expiry_days=7, db_path='file:testcache?mode=memory&cache=shared')
     
-    def tearDown(self):
-        """Cleanup test database"""
-        self.db.close()
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
+    @classmethod
+    def tearDownClass(cls):
+        """Close test database"""
+        cls.db.close()
+    
+    def setUp(self):
+        """Start every test from an empty cache"""
+        self.db.clear_cache()
     
     def test_save_and_retrieve_job(self):
         """Test saving and retrieving job data"""
@@ -135,10 +181,43 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(retrieved['name'], 'John Doe')
         self.assertEqual(retrieved['headline'], 'Software Engineer')
     
+    def test_get_cached_jobs_batch(self):
+        """Test batched job lookup"""
+        for i in range(3):
+            self.db.save_job(f'batch_key_{i}', {'title': f'Job {i}', 'url': f'http://test.com/{i}'})
+        
+        results = self.db.get_cached_jobs(['batch_key_0', 'batch_key_2', 'missing_key'])
+        
+        self.assertEqual(set(results), {'batch_key_0', 'batch_key_2'})
+        self.assertEqual(results['batch_key_2']['title'], 'Job 2')
+    
+    def test_save_jobs_batch(self):
+        """Test saving several jobs in one transaction"""
+        self.db.save_jobs([
+            (f'bulk_key_{i}', {'title': f'Job {i}', 'url': f'http://test.com/{i}'})
+            for i in range(3)
+        ])
+        
+        results = self.db.get_cached_jobs([f'bulk_key_{i}' for i in range(3)])
+        
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results['bulk_key_1']['title'], 'Job 1')
+    
+    def test_bulk_import_jobs(self):
+        """Test importing jobs through json_each"""
+        self.db.bulk_import_jobs([
+            (f'import_key_{i}', {'title': f'Job {i}', 'url': f'http://test.com/{i}'})
+            for i in range(3)
+        ])
+        
+        retrieved = self.db.get_cached_job('import_key_2')
+        
+        self.assertEqual(retrieved, {'title': 'Job 2', 'url': 'http://test.com/2'})
+    
     def test_cache_expiry(self):
         """Test cache expiry functionality"""
         # Create database with 0 day expiry
-        short_db = Database(cache_expiry_days=0, db_path='short_cache.db')
+        short_db = Database(cache_expiry_days=0, db_path='file:shortcache?mode=memory&cache=shared')
         
         cache_key = "expired_key"
         job_data = {'title': 'Test Job', 'url': 'http://test.com'}
@@ -150,8 +229,6 @@ class TestDatabase(unittest.TestCase):
         self.assertIsNone(retrieved)
         
         short_db.close()
-        if os.path.exists('short_cache.db'):
-            os.remove('short_cache.db')
     
     def test_get_cache_stats(self):
         """Test cache statistics"""
@@ -188,6 +265,190 @@ class TestDatabase(unittest.TestCase):
         # Search by company
         results = self.db.search_jobs(company='Company A')
         self.assertEqual(len(results), 1)
+    
+    def test_search_jobs_quoting(self):
+        """Test FTS5 operators in search input are matched as plain text"""
+        self.db.save_job('quoted_key', {
+            'title': 'Senior "C++" Developer - Remote',
+            'company': 'Acme*',
+            'location': 'NYC',
+            'url': 'http://test.com/quoted'
+        })
+        
+        self.assertEqual(len(self.db.search_jobs(keyword='"C++" Developer')), 1)
+        self.assertEqual(len(self.db.search_jobs(keyword='Developer - Remote')), 1)
+        self.assertEqual(len(self.db.search_jobs(company='Acme*')), 1)
+        self.assertEqual(len(self.db.search_jobs(keyword='-Remote')), 1)
+        
+        # '*' is not a prefix operator and a quote cannot close the phrase
+        self.assertEqual(self.db.search_jobs(keyword='Dev*'), [])
+        self.assertEqual(self.db.search_jobs(keyword='Developer" OR "Java'), [])
+    
+    def test_export_to_json(self):
+        """Test exporting a file-backed cache to JSON"""
+        job_data = {'title': 'Python Developer', 'url': 'http://test.com/job'}
+        profile_data = {'name': 'John Doe', 'url': 'http://test.com/profile'}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = Database(cache_expiry_days=7, db_path=os.path.join(tmp_dir, 'cache.db'))
+            db.save_job('export_job', job_data)
+            db.save_profile('export_profile', profile_data)
+            
+            output_file = os.path.join(tmp_dir, 'export.json')
+            db.export_to_json(output_file)
+            db.close()
+            
+            with open(output_file, encoding='utf-8') as f:
+                exported = json.load(f)
+        
+        self.assertEqual(exported['total_jobs'], 1)
+        self.assertEqual(exported['total_profiles'], 1)
+        self.assertEqual(exported['jobs'], [job_data])
+        self.assertEqual(exported['profiles'], [profile_data])
+        self.assertIn('export_date', exported)
+    
+    def test_clear_cache_compact(self):
+        """Test clearing old entries releases pages with incremental vacuum"""
+        description = 'x' * 4000
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = Database(cache_expiry_days=7, db_path=os.path.join(tmp_dir, 'cache.db'))
+            db.save_jobs([
+                (f'old_key_{i}', {'title': f'Old {i}', 'description': description})
+                for i in range(50)
+            ])
+            db.save_job('new_key', {'title': 'New', 'description': description})
+            
+            # Age the old entries by 30 days
+            with db.conn:
+                db.conn.execute(
+                    "UPDATE jobs SET scraped_at = scraped_at - 30 * 86400 WHERE cache_key LIKE 'old_key_%'"
+                )
+            pages_before = db.conn.execute('PRAGMA page_count').fetchone()[0]
+            
+            db.clear_cache(older_than_days=10, compact=True)
+            
+            self.assertEqual(db.conn.execute('PRAGMA auto_vacuum').fetchone()[0], 2)
+            self.assertEqual(db.conn.execute('PRAGMA freelist_count').fetchone()[0], 0)
+            self.assertLess(db.conn.execute('PRAGMA page_count').fetchone()[0], pages_before)
+            self.assertIsNone(db.get_cached_job('old_key_0'))
+            self.assertEqual(db.get_cached_job('new_key')['title'], 'New')
+            
+            # Clearing everything with compact runs a full VACUUM
+            db.clear_cache(compact=True)
+            
+            self.assertEqual(db.conn.execute('PRAGMA freelist_count').fetchone()[0], 0)
+            self.assertEqual(db.get_cache_stats()['total_jobs'], 0)
+            db.close()
+    
+    def test_reader_pool(self):
+        """Test a file-backed cache reads its writes back through the reader pool"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = Database(cache_expiry_days=7, db_path=os.path.join(tmp_dir, 'cache.db'))
+            self.assertIsNotNone(db._readers)
+            
+            db.save_jobs([
+                (f'pool_key_{i}', {'title': f'Python Job {i}', 'url': f'http://test.com/{i}'})
+                for i in range(20)
+            ])
+            
+            # Readers are read-only connections
+            with db._reader() as conn:
+                self.assertIsNot(conn, db.conn)
+                self.assertEqual(conn.execute('PRAGMA query_only').fetchone()[0], 1)
+                with self.assertRaises(sqlite3.OperationalError):
+                    conn.execute('DELETE FROM jobs')
+            
+            # Concurrent lookups, each on a pooled connection
+            errors = []
+            
+            def read_all():
+                try:
+                    for i in range(20):
+                        self.assertEqual(db.get_cached_job(f'pool_key_{i}')['title'], f'Python Job {i}')
+                    self.assertEqual(len(db.get_cached_jobs([f'pool_key_{i}' for i in range(20)])), 20)
+                except Exception as e:
+                    errors.append(e)
+            
+            threads = [threading.Thread(target=read_all) for _ in range(Database.READER_POOL_SIZE * 2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            self.assertEqual(errors, [])
+            self.assertEqual(db.get_cache_stats()['total_jobs'], 20)
+            self.assertEqual(len(db.search_jobs(keyword='Python', limit=50)), 20)
+            
+            # Readers see writes made after they were opened
+            db.clear_cache()
+            self.assertEqual(db.get_cache_stats()['total_jobs'], 0)
+            self.assertEqual(db.search_jobs(keyword='Python'), [])
+            self.assertIsNone(db.get_cached_job('pool_key_0'))
+            
+            db.save_job('pool_key_0', {'title': 'Python Job again', 'url': 'http://test.com/0'})
+            self.assertEqual(db.get_cached_job('pool_key_0')['title'], 'Python Job again')
+            self.assertEqual(db.get_cached_jobs(['pool_key_0', 'pool_key_1']).keys(), {'pool_key_0'})
+            self.assertEqual(db.get_cache_stats()['total_jobs'], 1)
+            db.close()
+    
+    def test_migrate_baseline_schema(self):
+        """Test a database with the original schema is migrated to the current one"""
+        scraped_at = datetime.now().isoformat()
+        job_data = {'title': 'Python Developer', 'company': 'Tech Corp', 'url': 'http://test.com/job'}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, 'cache.db')
+            
+            # Original schema: plain columns, ISO timestamps, JSON text payloads
+            conn = sqlite3.connect(db_path)
+            conn.executescript('''
+                CREATE TABLE jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cache_key TEXT UNIQUE NOT NULL,
+                    title TEXT, company TEXT, location TEXT, description TEXT,
+                    posted_date TEXT, job_type TEXT, seniority_level TEXT, job_url TEXT,
+                    scraped_at TIMESTAMP NOT NULL,
+                    data_json TEXT NOT NULL,
+                    UNIQUE(cache_key)
+                );
+                CREATE TABLE profiles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cache_key TEXT UNIQUE NOT NULL,
+                    name TEXT, headline TEXT, location TEXT, about TEXT,
+                    connections TEXT, profile_url TEXT,
+                    scraped_at TIMESTAMP NOT NULL,
+                    data_json TEXT NOT NULL,
+                    UNIQUE(cache_key)
+                );
+                CREATE INDEX idx_jobs_cache_key ON jobs(cache_key);
+                CREATE INDEX idx_jobs_scraped_at ON jobs(scraped_at);
+                CREATE INDEX idx_profiles_cache_key ON profiles(cache_key);
+                CREATE INDEX idx_profiles_scraped_at ON profiles(scraped_at);
+            ''')
+            with conn:
+                conn.execute(
+                    'INSERT INTO jobs (cache_key, title, company, job_url, scraped_at, data_json) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    ('legacy_key', job_data['title'], job_data['company'], job_data['url'],
+                     scraped_at, json.dumps(job_data))
+                )
+            conn.close()
+            
+            db = Database(cache_expiry_days=7, db_path=db_path)
+            
+            self.assertEqual(db.conn.execute('PRAGMA user_version').fetchone()[0], Database.SCHEMA_VERSION)
+            self.assertEqual(db.get_cached_job('legacy_key'), job_data)
+            self.assertEqual(
+                db.conn.execute('SELECT title, job_url, typeof(scraped_at) FROM jobs').fetchone(),
+                ('Python Developer', 'http://test.com/job', 'integer')
+            )
+            self.assertEqual(db.search_jobs(keyword='Python'), [job_data])
+            
+            indexes = {row[0] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            self.assertNotIn('idx_jobs_cache_key', indexes)
+            self.assertNotIn('idx_profiles_cache_key', indexes)
+            db.close()
 
 
 class TestConfig(unittest.TestCase):
@@ -206,9 +467,144 @@ class TestConfig(unittest.TestCase):
         """Test configuration validation"""
         # Should not raise any errors with valid config
         try:
-            Config.validate()
+            Config()
         except ValueError:
             self.fail("Config validation raised ValueError unexpectedly")
+        
+        # Invalid values are rejected on construction
+        with self.assertRaises(ValueError):
+            Config(MAX_RETRIES=0)
+
+
+class TestParsers(unittest.TestCase):
+    """Test page parsing on fixture HTML (no browser)"""
+    
+    def test_profile_from_embedded_json(self):
+        """Test profile fields are read from the embedded JSON state"""
+        payload = {
+            'data': {},
+            'included': [
+                'urn:li:fsd_profile:ACoAAA',
+                {'$type': 'com.linkedin.voyager.dash.common.Geo', 'firstName': 'Not a profile'},
+                {
+                    '$type': 'com.linkedin.voyager.dash.identity.profile.Profile',
+                    'firstName': 'John',
+                    'lastName': 'Doe',
+                    'headline': 'Software Engineer',
+                    'geoLocationName': 'San Francisco',
+                    'summary': ''
+                }
+            ]
+        }
+        html = (
+            '<code>{"data": not json</code>'
+            '<code>{"data": {}, "included": 42}</code>'
+            f'<code>{json.dumps(payload)}</code>'
+        )
+        
+        self.assertEqual(_profile_from_embedded_json(LexborHTMLParser(html)), {
+            'name': 'John Doe',
+            'headline': 'Software Engineer',
+            'location': 'San Francisco'
+        })
+    
+    def test_profile_from_embedded_json_malformed(self):
+        """Test malformed or missing JSON state yields no fields"""
+        html = (
+            '<code>{"data": {}, "included": ["urn:li:fsd_profile:ACoAAA", null, 7]}</code>'
+            '<code>{"data": []}</code>'
+            '<code>not json at all</code>'
+        )
+        
+        self.assertEqual(_profile_from_embedded_json(LexborHTMLParser(html)), {})
+        self.assertEqual(_profile_from_embedded_json(LexborHTMLParser('<p>No state</p>')), {})
+    
+    def test_parse_guest_job(self):
+        """Test parsing the guest job posting fragment"""
+        html = '''
+            <h2 class="top-card-layout__title">Python Developer</h2>
+            <a class="topcard__org-name-link">  Tech Corp </a>
+            <span class="topcard__flavor topcard__flavor--bullet">Remote</span>
+            <span class="posted-time-ago__text">2 days ago</span>
+            <div class="show-more-less-html__markup"><p>Build</p><p>crawlers</p></div>
+            <ul>
+                <li class="description__job-criteria-item">
+                    <h3>Seniority level</h3><span>Mid-Senior level</span>
+                </li>
+                <li class="description__job-criteria-item">
+                    <h3>Employment type</h3><span>Full-time</span>
+                </li>
+                <li class="description__job-criteria-item"><h3>Industries</h3><span>Software</span></li>
+                <li class="description__job-criteria-item"><h3>Job function</h3></li>
+            </ul>
+        '''
+        url = 'https://www.linkedin.com/jobs/view/123'
+        
+        crawler = LinkedInCrawler(replace(Config(), DATABASE_PATH='file:parsercache?mode=memory&cache=shared'))
+        try:
+            job = crawler._parse_guest_job(html, url)
+            empty = crawler._parse_guest_job('<html><body>Not found</body></html>', url)
+        finally:
+            crawler.close()
+        
+        self.assertEqual(job.url, url)
+        self.assertEqual(job.title, 'Python Developer')
+        self.assertEqual(job.company, 'Tech Corp')
+        self.assertEqual(job.location, 'Remote')
+        self.assertEqual(job.posted_date, '2 days ago')
+        self.assertEqual(job.description, 'Build crawlers')
+        self.assertEqual(job.seniority_level, 'Mid-Senior level')
+        self.assertEqual(job.job_type, 'Full-time')
+        
+        # Nothing recognisable: every field falls back to 'N/A'
+        self.assertEqual(empty.url, url)
+        self.assertEqual(
+            {field: value for field, value in empty.to_dict().items() if field not in ('url', 'scraped_at')},
+            dict.fromkeys(('title', 'company', 'location', 'description', 'posted_date', 'job_type', 'seniority_level'), 'N/A')
+        )
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the shared request rate limiter"""
+    
+    def test_burst_then_paced(self):
+        """Test a full bucket serves a burst, then callers wait for tokens"""
+        bucket = TokenBucket(rate=20, capacity=2)
+        
+        start = time.monotonic()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+        
+        # Four more tokens at 20 per second
+        for _ in range(4):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+    
+    def test_concurrent_callers_share_rate(self):
+        """Test threads draw from one bucket instead of one each"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+    
+    def test_acquire_async(self):
+        """Test the async form waits without blocking the event loop"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        
+        async def acquire_three():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+            return time.monotonic() - start
+        
+        self.assertGreaterEqual(asyncio.run(acquire_three()), 0.08)
 
 
 class TestCrawlerInitialization(unittest.TestCase):
@@ -216,8 +612,7 @@ class TestCrawlerInitialization(unittest.TestCase):
     
     def test_crawler_init(self):
         """Test crawler initialization"""
-        config = Config()
-        config.HEADLESS_MODE = True
+        config = replace(Config(), HEADLESS_MODE=True)
         
         crawler = LinkedInCrawler(config)
         
@@ -228,6 +623,144 @@ class TestCrawlerInitialization(unittest.TestCase):
         crawler.close()
 
 
+
+class TestCrawlerCache(unittest.TestCase):
+    """Test the crawler's cache lookups (no browser is started)"""
+    
+    def setUp(self):
+        config = replace(Config(), DATABASE_PATH='file:crawlercache?mode=memory&cache=shared')
+        self.crawler = LinkedInCrawler(config)
+    
+    def tearDown(self):
+        self.crawler.clear_cache()
+        self.crawler.close()
+    
+    def test_canonical_aliases(self):
+        """Test URLs with the same canonical form share one fetch and cache entry"""
+        url = 'https://www.linkedin.com/jobs/view/1'
+        alias = url + '/?trk=public_jobs'
+        fetched = []
+        
+        async def fake_fetch(client, job_url):
+            fetched.append(job_url)
+            return JobPosting(url=job_url, scraped_at=datetime.now().isoformat(), title='Python Developer')
+        
+        self.crawler._fetch_job = fake_fetch
+        
+        results = self.crawler.scrape_jobs_bulk([url, alias])
+        self.assertEqual(fetched, [url])
+        self.assertEqual([job['title'] for job in results], ['Python Developer'] * 2)
+        self.assertEqual(results[0], results[1])
+        
+        # Both aliases are now served from the cache
+        cached = self.crawler.get_cached_jobs([url, alias])
+        self.assertEqual(set(cached), {url, alias})
+        self.assertEqual(self.crawler.scrape_jobs_bulk([alias, url]), results)
+        self.assertEqual(len(fetched), 1)
+
+    
+    def test_failed_fetch_does_not_abort_bulk(self):
+        """Test an error fetching one job yields None for it and keeps the others"""
+        bad_url = 'https://www.linkedin.com/jobs/view/10'
+        good_url = 'https://www.linkedin.com/jobs/view/11'
+        
+        async def fake_fetch(client, job_url):
+            if job_url == bad_url:
+                raise ValueError('undecodable response')
+            return JobPosting(url=job_url, scraped_at=datetime.now().isoformat(), title='Python Developer')
+        
+        self.crawler._fetch_job = fake_fetch
+        
+        bad, good = self.crawler.scrape_jobs_bulk([bad_url, good_url])
+        self.assertIsNone(bad)
+        self.assertEqual(good['title'], 'Python Developer')
+    
+    def test_memory_cache_ttl(self):
+        """Test in-memory entries expire with their scrape time and evict oldest first"""
+        expired_at = (datetime.now() - timedelta(days=self.crawler.config.CACHE_EXPIRY_DAYS, minutes=1)).isoformat()
+        
+        self.crawler._remember('fresh', JobPosting(url='u1', scraped_at=datetime.now().isoformat()))
+        self.crawler._remember('expired', JobPosting(url='u2', scraped_at=expired_at))
+        self.crawler._remember('odd_timestamp', {'url': 'u3', 'scraped_at': 'yesterday'})
+        
+        self.assertEqual(self.crawler._recall('fresh')['url'], 'u1')
+        self.assertIsNone(self.crawler._recall('expired'))
+        self.assertNotIn('expired', self.crawler._mem_cache)
+        self.assertEqual(self.crawler._recall('odd_timestamp'), {'url': 'u3', 'scraped_at': 'yesterday'})
+        
+        # Recalled entries are copies
+        self.crawler._recall('fresh')['url'] = 'changed'
+        self.assertEqual(self.crawler._recall('fresh')['url'], 'u1')
+        
+        # Least recently used entries go first
+        self.crawler.MEM_CACHE_MAX = 2
+        self.crawler._recall('fresh')
+        self.crawler._remember('newest', JobPosting(url='u4', scraped_at=datetime.now().isoformat()))
+        self.assertEqual(list(self.crawler._mem_cache), ['fresh', 'newest'])
+    
+    def test_cookie_cache_round_trip(self):
+        """Test saved cookies are reloaded per account and kept private"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'nested', 'cookies.json')
+            self.crawler.config = replace(self.crawler.config, COOKIE_CACHE_PATH=path)
+            
+            self.crawler._save_cookies('a@example.com', [{'name': 'li_at', 'value': '1'}])
+            self.crawler._save_cookies('b@example.com', [{'name': 'li_at', 'value': '2'}])
+            
+            self.assertEqual(self.crawler._load_cookies('a@example.com'), [{'name': 'li_at', 'value': '1'}])
+            self.assertEqual(self.crawler._load_cookies('b@example.com'), [{'name': 'li_at', 'value': '2'}])
+            self.assertEqual(self.crawler._load_cookies('c@example.com'), [])
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+    
+    def test_cookie_cache_malformed(self):
+        """Test stale, malformed or unwritable cookie files never raise"""
+        stale = (datetime.now() - timedelta(days=8)).isoformat()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'cookies.json')
+            self.crawler.config = replace(self.crawler.config, COOKIE_CACHE_PATH=path)
+            
+            for content in (
+                json.dumps({'a@example.com': {'saved_at': stale, 'cookies': [{}]}}),
+                json.dumps({'a@example.com': {'cookies': [{}]}}),
+                json.dumps({'a@example.com': {'saved_at': 'yesterday', 'cookies': [{}]}}),
+                json.dumps({'a@example.com': 'urn:li:cookie'}),
+                json.dumps(['a@example.com']),
+                '{not json'
+            ):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                self.assertEqual(self.crawler._load_cookies('a@example.com'), [], content)
+            
+            # The parent "directory" is a file: the save is logged, not raised
+            blocker = os.path.join(tmp_dir, 'blocker')
+            open(blocker, 'w').close()
+            self.crawler.config = replace(
+                self.crawler.config, COOKIE_CACHE_PATH=os.path.join(blocker, 'cookies.json')
+            )
+            self.crawler._save_cookies('a@example.com', [{}])
+    
+    def test_cached_payload_without_record_fields(self):
+        """Test cached rows lacking url/scraped_at (or with odd timestamps) are served as stored"""
+        url = 'https://www.linkedin.com/jobs/view/2'
+        other_url = 'https://www.linkedin.com/jobs/view/3'
+        job_data = {'title': 'Imported Job'}
+        odd_data = {'title': 'Odd Job', 'url': other_url, 'scraped_at': 'yesterday'}
+        self.crawler.db.bulk_import_jobs([
+            (generate_cache_key(url), job_data),
+            (generate_cache_key(other_url), odd_data)
+        ])
+        
+        # Database hit, then in-memory hit
+        self.assertEqual(self.crawler.scrape_job(url), job_data)
+        self.assertEqual(self.crawler.scrape_job(url), job_data)
+        self.assertEqual(
+            self.crawler.get_cached_jobs([url, other_url]),
+            {url: job_data, other_url: odd_data}
+        )
+        self.assertEqual(self.crawler.scrape_jobs_bulk([other_url]), [odd_data])
+
+
 def run_tests():
     """Run all tests"""
     # Create test suite